@@ -1,7 +1,8 @@
 import click
 
-from . import _check_log, _run, _subtasks_run_adhoc, _subtasks_setup
-from ._subtasks_setup import SUBTASK_DIR
+# Kept in sync with _subtasks_setup.SUBTASK_DIR, which is not imported here so
+# that CLI startup does not pay for the subtask modules' dependencies
+SUBTASK_DIR = "subtasks"
 
 
 @click.group()
@@ -26,6 +27,8 @@ def run(path: str = ".", safemode_off: bool = False):
     The AutoMech directory must contain an `inp/` subdirectory with the following
     required files: run.dat, theory.dat, models.dat, species.csv, mechanism.dat
     """
+    from . import _run
+
     _run.main(path=path, safemode_off=safemode_off)
 
 
@@ -39,6 +42,8 @@ def check_log(path: str = "."):
     The path must point either directly to the log file, or to a directory where the log
     file is named "out.log"
     """
+    from . import _check_log
+
     _check_log.main(path=path)
 
 
@@ -84,6 +89,8 @@ def setup(
     The AutoMech directory must contain an `inp/` subdirectory with the following
     required files: run.dat, theory.dat, models.dat, species.csv, mechanism.dat
     """
+    from . import _subtasks_setup
+
     _subtasks_setup.main(
         path=path, out_path=out_path, save_path=save_path, run_path=run_path
     )
@@ -105,4 +112,6 @@ def setup(
 )
 def run_adhoc(path: str = SUBTASK_DIR, nodes: str | None=None , activation_hook: str | None = None):
     """Run subtasks in parallel on an Ad Hoc SSH Cluster"""
+    from . import _subtasks_run_adhoc
+
     _subtasks_run_adhoc.main(path=path, nodes=nodes, activation_hook=activation_hook)
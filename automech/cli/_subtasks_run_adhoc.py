@@ -1,13 +1,11 @@
 """ Standalone script to run AutoMech subtasks in parallel on an Ad Hoc SSH Cluster
 """
 
+import csv
 import itertools
 import subprocess
 from pathlib import Path
 
-import pandas
-import yaml
-
 from ._subtasks_setup import (
     INFO_FILE,
     SUBTASK_DIR,
@@ -16,6 +14,7 @@ from ._subtasks_setup import (
     TableKey,
     Task,
     read_task_list,
+    read_yaml,
 )
 
 SCRIPT_DIR = Path(__file__).parent / "scripts"
@@ -41,7 +40,7 @@ def main(
     ), f"Path not found: {path}.\nDid you run `automech subtasks setup` first?"
 
     info_path = path / INFO_FILE
-    info_dct = yaml.safe_load(info_path.read_text())
+    info_dct = read_yaml(info_path)
 
     group_ids = info_dct[InfoKey.group_ids]
     work_path = info_dct[InfoKey.work_path]
@@ -51,10 +50,16 @@ def main(
     run_path.mkdir(exist_ok=True)
     save_path.mkdir(exist_ok=True)
 
-    for group_id in group_ids[:1]:
-        df = pandas.read_csv(path / f"{group_id}.csv")
+    # Assemble the full submission list up front, then run the tasks in order
+    # (tasks within a group, and the groups themselves, are potentially
+    # sequential, so they cannot be overlapped; each invocation already fans its
+    # subtasks out across the cluster in parallel)
+    run_args_lst = []
+    for group_id in group_ids:
+        with open(path / f"{group_id}.csv", newline="") as csv_file:
+            rows = list(csv.DictReader(csv_file))
         tasks = read_task_list(path / f"{group_id}.yaml")
-        for task_key, row in df.iterrows():
+        for task_key, row in enumerate(rows):
             task: Task = tasks[task_key]
             assert row[TableKey.task] == task.name, f"{row} does not match {task.name}"
 
@@ -64,18 +69,22 @@ def main(
             for key, nworkers in zip(
                 task.subtask_keys, task.subtask_nworkers, strict=True
             ):
-                path = row.get(str(key))
-                subtask_paths.extend([path] * nworkers)
+                subtask_path = row.get(str(key))
+                subtask_paths.extend([subtask_path] * nworkers)
                 subtask_logs.extend([f"out{i}.log" for i in range(nworkers)])
 
-            run_args = [
-                RUN_SCRIPT,
-                work_path,
-                f"{task.mem}",
-                f"{task.nprocs}",
-                ",".join(subtask_paths),
-                ",".join(subtask_logs),
-                nodes,
-                "" if activation_hook is None else activation_hook,
-            ]
-            subprocess.run(run_args)
+            run_args_lst.append(
+                [
+                    RUN_SCRIPT,
+                    work_path,
+                    f"{task.mem}",
+                    f"{task.nprocs}",
+                    ",".join(subtask_paths),
+                    ",".join(subtask_logs),
+                    nodes,
+                    "" if activation_hook is None else activation_hook,
+                ]
+            )
+
+    for run_args in run_args_lst:
+        subprocess.run(run_args, check=False)
@@ -1,21 +1,45 @@
 """ Standalone script to break an AutoMech input into subtasks for parallel execution
 """
 
+from __future__ import annotations
+
+import csv
 import dataclasses
+import functools
 import io
 import os
+import pickle
 import re
-import textwrap
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from typing import TYPE_CHECKING
 
-import automol
-import more_itertools as mit
-import pandas
 import pyparsing as pp
-import yaml
 from pyparsing import common as ppc
 
+# automol, pandas, more_itertools, and yaml are imported lazily inside the
+# functions that need them, to keep CLI startup light for the other commands
+if TYPE_CHECKING:
+    import pandas
+
+
+@functools.lru_cache(maxsize=1)
+def _yaml():
+    """Import PyYAML lazily, returning the module along with the fastest safe
+    loader and dumper available (the LibYAML C bindings are ~10x faster than
+    the pure-Python fallbacks)
+    """
+    import yaml
+
+    loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+    dumper = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
+    return yaml, loader, dumper
+
 COMMENT_REGEX = re.compile(r"#.*$", flags=re.M)
+INDEX_SERIES_REGEX = re.compile(r"(\d+)(?:\s*-\s*(\d+))?")
+BLANK_LINE_REGEX = re.compile(r"^ +(?=[ \t]*$)", flags=re.M)
+INDENT_REGEX = re.compile(r"^ *(?=[^\n]*\S)", flags=re.M)
 
 DEFAULT_GROUPS = (
     ("els", "spc"),
@@ -25,6 +49,7 @@ DEFAULT_GROUPS = (
 )
 
 SUBTASK_DIR = "subtasks"
+SHARED_DIR = "_shared"
 INFO_FILE = "info.yaml"
 
 SAMP_TASKS = ("conf_samp",)
@@ -51,14 +76,17 @@ class SpecKey:
     worker_counts = "worker_counts"
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(frozen=True, slots=True)
 class Task:
     name: str
     line: str
     mem: int
     nprocs: int
-    subtask_keys: list[int]
-    subtask_nworkers: list[int]
+    subtask_keys: tuple[int, ...]
+    subtask_nworkers: tuple[int, ...]
+
+
+TASK_FIELD_NAMES = tuple(f.name for f in dataclasses.fields(Task))
 
 
 def main(
@@ -99,6 +127,14 @@ def main(
     out_path = Path(out_path)
     out_path.mkdir(exist_ok=True)
 
+    # Write the input files shared by all subtasks once, so they can be
+    # hard-linked into the subtask directories instead of rewritten
+    shared_dir = out_path / SHARED_DIR / "inp"
+    shared_dir.mkdir(parents=True, exist_ok=True)
+    for name, contents in file_dct.items():
+        if name != "run.dat":
+            (shared_dir / name).write_bytes(_encoded_file_text(contents))
+
     # Set up each subtask group
     group_ids = list(range(len(groups)))
     for group_id, (task_type, key_type) in zip(group_ids, groups, strict=True):
@@ -109,6 +145,7 @@ def main(
             key_type=key_type,
             group_id=group_id,
             out_path=out_path,
+            shared_dir=shared_dir,
         )
 
     # Write the subtask info to YAML
@@ -120,7 +157,7 @@ def main(
         InfoKey.work_path: os.getcwd(),
         InfoKey.group_ids: group_ids,
     }
-    info_path.write_text(yaml.safe_dump(info_dct))
+    write_yaml(info_dct, info_path)
 
 
 def setup_subtask_group(
@@ -130,7 +167,8 @@ def setup_subtask_group(
     key_type: str | None = None,
     group_id: str | int | None = None,
     out_path: str | Path = SUBTASK_DIR,
-) -> pandas.DataFrame:
+    shared_dir: str | Path | None = None,
+) -> list[dict[object, Path]]:
     """Set up a group of subtasks from a run dictionary, creating run directories and
     returning them in a table
 
@@ -138,8 +176,11 @@ def setup_subtask_group(
     :param task_type: The type of task: 'els', 'thermo', or 'kin'
     :param key_type: The type of subtask key: 'spc', 'pes', or `None`
     :param group_id: The group ID, used to name files and folders
-    :return: A DataFrame of run paths, whose columns (subtasks) are independent and can
-        be run in parallel, but whose rows (tasks) are potentially sequential
+    :param shared_dir: A directory of canonical input files that can be hard-linked
+        into the subtask directories instead of rewritten
+    :return: A table of run paths as one row dictionary per task, whose columns
+        (subtasks) are independent and can be run in parallel, but whose rows
+        (tasks) are potentially sequential
     """
 
     def _subtask_directory(key):
@@ -178,37 +219,65 @@ def setup_subtask_group(
     print(f"Writing task specs to {yaml_path}")
     write_task_list(tasks, yaml_path)
 
-    # Create directories for each subtask and save the paths in a DataFrame
+    # Determine the directory and input files for each subtask and save the paths
+    # in a DataFrame
     row_dcts = []
+    write_jobs = []
     for task_key, task in enumerate(tasks):
         row_dct = {TableKey.task: task.name}
         task_path = out_path / f"{group_id}_{task_key:02d}_{task.name}"
         print(f"Setting up subtask directories in {task_path}")
+        # Pre-create the shared parent here, so each subtask worker only has to
+        # create its leaf directory
+        task_path.mkdir(parents=True, exist_ok=True)
         task_run_dct = {k: v for k, v in run_dct.items() if k in block_keys}
         task_run_dct[task_type] = task.line
+        # Pre-form the parts of the run.dat that are fixed across subtasks; only
+        # the key-type block differs, so the inner loop is a three-way concat of
+        # the precomputed head/tail around the subtask block
+        prefix, suffix = form_run_dat_split(task_run_dct, variable_key=key_type)
+        head = f"{prefix}{key_type}\n"
+        tail = f"\nend {key_type}\n\n{suffix}"
+        all_run_dat = prefix + suffix
         for key in task.subtask_keys:
             # Generate the subtask path
             subtask_path = task_path / _subtask_directory(key)
-            subtask_path.mkdir(parents=True, exist_ok=True)
             # Generate the input file dictionary
-            subtask_run_dct = task_run_dct.copy()
-            if key != all_key:
-                subtask_run_dct[key_type] = _subtask_block(key)
-            subtask_file_dct = {**file_dct, "run.dat": form_run_dat(subtask_run_dct)}
-            # Write the input files and append the path to the current dataframe row
-            write_input_files(subtask_path, subtask_file_dct)
+            if key == all_key:
+                run_dat = all_run_dat
+            else:
+                run_dat = head + format_block(_subtask_block(key)) + tail
+            subtask_file_dct = {**file_dct, "run.dat": run_dat}
+            # Queue the directory for writing and append the path to the current row
+            write_jobs.append((subtask_path, subtask_file_dct, shared_dir))
             row_dct[key] = subtask_path
         row_dcts.append(row_dct)
 
-    df = pandas.DataFrame(row_dcts)
+    # Write the subtask directories with a thread pool, so the blocking I/O calls
+    # overlap (this is nearly free on a local disk, but a large win on the
+    # networked filesystems where these workflows usually run)
+    nworkers = min(32, (os.cpu_count() or 1) * 4)
+    with ThreadPoolExecutor(max_workers=nworkers) as pool:
+        list(pool.map(_write_subtask_directory, write_jobs))
 
-    # Write the subtask table to CSV
+    # Write the subtask table to CSV (a plain string table, so csv.DictWriter
+    # does the job without the pandas constructor overhead)
     csv_path = out_path / f"{group_id}.csv"
     print(f"Writing subtask table to {csv_path}")
-    df.to_csv(csv_path, index=False)
+    fieldnames = [TableKey.task]
+    for row_dct in row_dcts:
+        fieldnames.extend(
+            str(k) for k in row_dct if k != TableKey.task and str(k) not in fieldnames
+        )
+    with open(csv_path, "w", newline="") as csv_file:
+        writer = csv.DictWriter(csv_file, fieldnames=fieldnames, restval="")
+        writer.writeheader()
+        writer.writerows(
+            {str(k): str(v) for k, v in row_dct.items()} for row_dct in row_dcts
+        )
     print()
 
-    return df
+    return row_dcts
 
 
 def determine_task_list(
@@ -222,43 +291,137 @@ def determine_task_list(
     returning them in a table
 
     """
-    keys = subtask_keys_from_run_dict(run_dct, key_type, all_key=all_key)
+    keys = tuple(subtask_keys_from_run_dict(run_dct, key_type, all_key=all_key))
 
-    return [
-        Task(
-            name=parse_task_name(task_line),
-            line=task_line,
-            mem=parse_task_memory(task_line, file_dct),
-            nprocs=parse_task_nprocs(task_line, file_dct),
-            subtask_keys=keys,
-            subtask_nworkers=parse_subtasks_nworkers(
-                task_line, file_dct, nsub=len(keys)
-            ),
+    # Parse the theory and species files once, up front, and thread them through
+    # the per-task helpers below
+    theory_dct = parse_theory_dat(file_dct.get("theory.dat"))
+    spc_df = parse_species_csv(file_dct.get("species.csv"))
+
+    tasks = []
+    for task_line in task_lines_from_run_dict(run_dct, task_type, key_type):
+        # Parse the in-line fields once and share them across the helpers below
+        field_dct = parse_task_fields(task_line)
+        tasks.append(
+            Task(
+                name=parse_task_name(task_line),
+                line=task_line,
+                mem=_task_memory(field_dct, theory_dct),
+                nprocs=_task_nprocs(field_dct, theory_dct),
+                subtask_keys=keys,
+                subtask_nworkers=tuple(
+                    _subtasks_nworkers(task_line, field_dct, spc_df, nsub=len(keys))
+                ),
+            )
         )
-        for task_line in task_lines_from_run_dict(run_dct, task_type, key_type)
-    ]
+    return tasks
 
 
 # Functions acting on the run directory as a whole
+INPUT_FILE_NAMES = ("run.dat", "theory.dat", "models.dat", "mechanism.dat", "species.csv")
+
+_READ_CACHE_MAX_SIZE = 32
+_READ_CACHE: OrderedDict = OrderedDict()
+
+
 def read_input_files(run_dir: str | Path) -> dict[str, str]:
     inp_dir = Path(run_dir) / "inp"
-    return {
-        "run.dat": (inp_dir / "run.dat").read_text(),
-        "theory.dat": (inp_dir / "theory.dat").read_text(),
-        "models.dat": (inp_dir / "models.dat").read_text(),
-        "mechanism.dat": (inp_dir / "mechanism.dat").read_text(),
-        "species.csv": (inp_dir / "species.csv").read_text(),
-    }
+    # Cache file contents on (path, mtime, size), so repeated calls skip the reads
+    stats = [(name, (inp_dir / name).stat()) for name in INPUT_FILE_NAMES]
+    key = (str(inp_dir), tuple((n, s.st_mtime_ns, s.st_size) for n, s in stats))
+    if key in _READ_CACHE:
+        _READ_CACHE.move_to_end(key)
+        return dict(_READ_CACHE[key])
+
+    # Read the files through a thread pool, so the read syscalls overlap (the
+    # latency matters on networked filesystems, not the decoding)
+    paths = [inp_dir / name for name in INPUT_FILE_NAMES]
+    with ThreadPoolExecutor(max_workers=len(paths)) as pool:
+        contents = pool.map(_read_file_text, paths)
+    file_dct = dict(zip(INPUT_FILE_NAMES, contents, strict=True))
+    _READ_CACHE[key] = file_dct
+    if len(_READ_CACHE) > _READ_CACHE_MAX_SIZE:
+        _READ_CACHE.popitem(last=False)
+    return dict(file_dct)
+
+
+def _write_subtask_directory(job: tuple[Path, dict[str, str], Path | None]) -> None:
+    """Create a subtask directory and write its input files (thread pool worker)
+
+    :param job: The subtask directory path, its input file dictionary, and the
+        shared input directory (if any)
+    """
+    subtask_path, file_dct, shared_dir = job
+    subtask_path.mkdir(exist_ok=True)
+    write_input_files(subtask_path, file_dct, shared_dir=shared_dir)
+
 
+# The inp/ files are ASCII; latin-1 decoding round-trips arbitrary bytes
+# losslessly and skips the UTF-8 validation state machine on multi-MB files
+def _read_file_text(path: str | Path) -> str:
+    return Path(path).read_bytes().decode("latin-1")
 
-def write_input_files(run_dir: str | Path, file_dct: dict[str, str]) -> None:
+
+@functools.lru_cache(maxsize=128)
+def _encoded_file_text(contents: str) -> bytes:
+    """Encode input file contents for writing, cached since the same contents
+    are written into many subtask directories
+
+    :param contents: The file contents
+    :return: The encoded contents
+    """
+    return contents.encode("latin-1")
+
+
+@functools.lru_cache(maxsize=32)
+def _shared_file_text(path: str) -> str:
+    """Read a shared input file, caching the contents (the shared files are
+    written once before any subtask setup and do not change afterwards)
+
+    :param path: The path to the shared input file
+    :return: The file contents
+    """
+    return _read_file_text(path)
+
+
+def write_input_files(
+    run_dir: str | Path, file_dct: dict[str, str], shared_dir: str | Path | None = None
+) -> None:
     inp_dir = Path(run_dir) / "inp"
     inp_dir.mkdir(exist_ok=True)
     for name, contents in file_dct.items():
-        (inp_dir / name).write_text(contents)
+        path = inp_dir / name
+        shared_path = None if shared_dir is None else Path(shared_dir) / name
+        if (
+            shared_path is not None
+            and shared_path.is_file()
+            and _shared_file_text(str(shared_path)) == contents
+        ):
+            # Hard-link unchanged input files instead of rewriting the bytes
+            if path.exists():
+                path.unlink()
+            try:
+                os.link(shared_path, path)
+            except OSError:
+                # Hard links may not be supported across devices; write normally
+                path.write_bytes(_encoded_file_text(contents))
+            continue
+        path.write_bytes(_encoded_file_text(contents))
 
 
 # Parse task information
+# Grammar for in-line `key=val` fields, built once at import time (pyparsing
+# grammar construction is expensive; the objects are thread-safe for parsing)
+_TASK_FIELD_WORD = pp.Word(pp.printables, exclude_chars="=")
+_TASK_FIELD = pp.Group(
+    _TASK_FIELD_WORD + pp.Suppress(pp.Literal("=")) + _TASK_FIELD_WORD
+)
+_TASK_FIELDS_EXPR = pp.Suppress(...) + pp.DelimitedList(
+    _TASK_FIELD, delim=pp.WordEnd()
+)
+
+
+@functools.lru_cache(maxsize=1024)
 def parse_task_name(task_line: str) -> str:
     """Parse the task name from a task line
 
@@ -271,17 +434,17 @@ def parse_task_name(task_line: str) -> str:
     return task_name
 
 
+@functools.lru_cache(maxsize=1024)
 def parse_task_fields(task_line: str) -> dict[str, str]:
     """Parse in-line fields of the form `key=val`
 
+    Results are cached per task line; callers must not mutate the returned
+    dictionary
+
     :param inp: The string to parse
     :return: The fields, as a dictionary
     """
-    word = pp.Word(pp.printables, exclude_chars="=")
-    eq = pp.Suppress(pp.Literal("="))
-    field = pp.Group(word + eq + word)
-    expr = pp.Suppress(...) + pp.DelimitedList(field, delim=pp.WordEnd())
-    return dict(expr.parseString(task_line).as_list())
+    return dict(_TASK_FIELDS_EXPR.parseString(task_line).as_list())
 
 
 def parse_task_memory(task_line: str, file_dct: dict[str, str]) -> int:
@@ -291,13 +454,17 @@ def parse_task_memory(task_line: str, file_dct: dict[str, str]) -> int:
     :param file_dct: The file dictionary
     :return: The memory requirement for the task
     """
-    field_dct = parse_task_fields(task_line)
+    theory_dct = parse_theory_dat(file_dct.get("theory.dat"))
+    return _task_memory(parse_task_fields(task_line), theory_dct)
+
 
+def _task_memory(
+    field_dct: dict[str, str], theory_dct: dict[str, dict[str, str]]
+) -> int:
     mem = None
 
     if "runlvl" in field_dct:
         runlvl = field_dct.get("runlvl")
-        theory_dct = parse_theory_dat(file_dct.get("theory.dat"))
         mem = int(float(theory_dct.get(runlvl).get("mem")))
 
     return mem
@@ -310,8 +477,13 @@ def parse_task_nprocs(task_line: str, file_dct: dict[str, str]) -> int:
     :param file_dct: The file dictionary
     :return: The memory and nprocs for the task
     """
-    field_dct = parse_task_fields(task_line)
+    theory_dct = parse_theory_dat(file_dct.get("theory.dat"))
+    return _task_nprocs(parse_task_fields(task_line), theory_dct)
 
+
+def _task_nprocs(
+    field_dct: dict[str, str], theory_dct: dict[str, dict[str, str]]
+) -> int:
     nprocs = None
 
     if "nprocs" in field_dct:
@@ -319,7 +491,6 @@ def parse_task_nprocs(task_line: str, file_dct: dict[str, str]) -> int:
 
     if "runlvl" in field_dct:
         runlvl = field_dct.get("runlvl")
-        theory_dct = parse_theory_dat(file_dct.get("theory.dat"))
         nprocs = int(float(theory_dct.get(runlvl).get("nprocs")))
 
     return nprocs
@@ -335,14 +506,19 @@ def parse_subtasks_nworkers(
     :param nsub: The
     :return: The memory and nprocs for the task
     """
+    spc_df = parse_species_csv(file_dct.get("species.csv"))
+    return _subtasks_nworkers(task_line, parse_task_fields(task_line), spc_df, nsub)
+
+
+def _subtasks_nworkers(
+    task_line: str, field_dct: dict[str, str], spc_df: pandas.DataFrame, nsub: int
+) -> list[int]:
     nworkers_lst = [1] * nsub
 
     if task_line.startswith("spc"):
         task_name = parse_task_name(task_line)
-        field_dct = parse_task_fields(task_line)
         if task_name in SAMP_TASKS or field_dct.get("cnf_range", "").startswith("n"):
             nmax = int(field_dct.get("cnf_range", "n100")[1:])
-            spc_df = parse_species_csv(file_dct.get("species.csv"))
             nsamp_lst = [
                 sample_count_from_inchi(chi, param_d=nmax) for chi in spc_df["inchi"]
             ]
@@ -352,36 +528,40 @@ def parse_subtasks_nworkers(
 
 
 # Functions acting on theory.dat data
+@functools.lru_cache(maxsize=128)
 def parse_theory_dat(theory_dat: str) -> dict[str, dict[str, str]]:
     """Parse a theory.dat file into a dictionary of dictionaries
 
+    Results are cached on the raw file contents, since this gets called once per
+    task line when determining task resource requirements
+
     :param theory_dat: The contents of the theory.dat file, as a string
     :return: The dictionary of the parsed theory.dat file
     """
     theory_dat = without_comments(theory_dat)
-    theory_expr = pp.OneOrMore(block_expression("level", key="content"))
-    blocks = theory_expr.parseString(theory_dat).as_list()
-
-    word = pp.Word(pp.printables)
-    eq = pp.Suppress(pp.Literal("="))
-    field = pp.Group(word("key") + eq + word("val"))
-    block_expr = word("key") + pp.DelimitedList(field, delim=pp.LineEnd())("fields")
+    blocks = _THEORY_BLOCKS_EXPR.parseString(theory_dat).as_list()
 
     theory_dct = {}
     for block in blocks:
-        res = block_expr.parseString(block)
+        res = _THEORY_BLOCK_EXPR.parseString(block)
         theory_dct[res.get("key")] = dict(res.get("fields").as_list())
 
     return theory_dct
 
 
 # Functions acting on species.csv data
+@functools.lru_cache(maxsize=128)
 def parse_species_csv(species_csv: str) -> pandas.DataFrame:
     """Parse a species.csv file into a pandas dataframe
 
+    Results are cached on the raw file contents; callers must not mutate the
+    returned dataframe
+
     :param species_csv: The contents of the species.csv file, as a string
     :return: The species table
     """
+    import pandas
+
     return pandas.read_csv(io.StringIO(species_csv), quotechar="'")
 
 
@@ -407,36 +587,54 @@ def sample_count_from_inchi(
     :param param_d: The `d` parameter used to calculate the sample count
     :return: The sample count
     """
-    gra = automol.amchi.graph(chi, stereo=False)
-    ntors = len(automol.graph.rotational_bond_keys(gra, with_ch_rotors=False))
+    ntors = _torsion_count_from_inchi(chi)
     if not ntors:
         return 1
 
     return min(param_a + param_b * param_c**ntors, param_d)
 
 
+@functools.lru_cache(maxsize=None)
+def _torsion_count_from_inchi(chi: str) -> int:
+    """Count the torsional degrees of freedom for a molecule from its InChI or
+    AMChI string
+
+    The graph build is expensive and the same species appear task after task,
+    so the result is cached by string
+
+    :param chi: An InChI or AMChI string
+    :return: The number of torsional degrees of freedom
+    """
+    import automol
+
+    gra = automol.amchi.graph(chi, stereo=False)
+    return len(automol.graph.rotational_bond_keys(gra, with_ch_rotors=False))
+
+
 # Functions acting on run.dat data
 def parse_run_dat(run_dat: str) -> dict[str, str]:
     """Parse a run.dat file into a dictionary of blocks
 
+    The parse is cached on the raw file contents; a fresh dictionary is built on
+    each call, so callers are free to modify it
+
     :param run_dat: The contents of the run.dat file, as a string
     :return: The dictionary of the parsed run.dat file
     """
+    return dict(_parse_run_dat_items(run_dat))
+
 
+@functools.lru_cache(maxsize=128)
+def _parse_run_dat_items(run_dat: str) -> tuple[tuple[str, str], ...]:
     def _parse_block(run_dat, keyword):
-        expr = block_expression(keyword, key="content")
-        content = expr.parseString(run_dat).get("content")
+        content = _BLOCK_EXPRS[keyword].parseString(run_dat).get("content")
         return format_block(content)
 
     run_dat = without_comments(run_dat)
-    return {
-        "input": _parse_block(run_dat, "input"),
-        "pes": _parse_block(run_dat, "pes"),
-        "spc": _parse_block(run_dat, "spc"),
-        "els": _parse_block(run_dat, "els"),
-        "thermo": _parse_block(run_dat, "thermo"),
-        "kin": _parse_block(run_dat, "kin"),
-    }
+    return tuple(
+        (key, _parse_block(run_dat, key))
+        for key in ("input", "pes", "spc", "els", "thermo", "kin")
+    )
 
 
 def form_run_dat(run_dct: dict[str, str]) -> str:
@@ -453,6 +651,30 @@ def form_run_dat(run_dct: dict[str, str]) -> str:
     return run_dat
 
 
+def form_run_dat_split(
+    run_dct: dict[str, str], variable_key: str | None = None
+) -> tuple[str, str]:
+    """Format the contents of a run.dat file, split around a variable block
+
+    The variable block is left out, so that per-subtask contents can be spliced
+    in between the two halves without re-forming the fixed blocks each time
+
+    :param run_dct: The dictionary of a parsed run.dat file
+    :param variable_key: The key of the block that varies between subtasks
+    :return: The run.dat contents before and after the variable block
+    """
+    keys = ["input", "spc", "pes", "els", "thermo", "kin"]
+    parts = ["", ""]
+    part_idx = 0
+    for key in keys:
+        if key == variable_key:
+            part_idx = 1
+            continue
+        if key in run_dct:
+            parts[part_idx] += f"{key}\n{format_block(run_dct.get(key))}\nend {key}\n\n"
+    return parts[0], parts[1]
+
+
 def filesystem_paths_from_run_dict(
     run_dct: dict[str, str],
     save_path: str | Path | None = None,
@@ -490,6 +712,7 @@ def subtask_keys_from_run_dict(
     :param run_dct: The dictionary of a parsed run.dat file
     :return: A sequence of indices for each individual species
     """
+    import more_itertools as mit
 
     if subtask_type is None:
         return [all_key]
@@ -501,15 +724,8 @@ def subtask_keys_from_run_dict(
     if subtask_type == "pes":
         pes_block = run_dct.get("pes")
 
-        colon = pp.Suppress(pp.Literal(":"))
-        before_line_end = pp.FollowedBy(pp.LineEnd())
-        entry = pp.Group(
-            ppc.integer("pes") + colon + pp.SkipTo(before_line_end)("channels")
-        )
-        expr = pp.DelimitedList(entry, delim=pp.LineEnd())
-
         keys = []
-        for res in expr.parseString(pes_block):
+        for res in _PES_EXPR.parseString(pes_block):
             pidx = res.get("pes")
             cidxs = parse_index_series(res.get("channels"))
             keys.extend((pidx, cidx) for cidx in cidxs)
@@ -537,6 +753,45 @@ def task_lines_from_run_dict(
     return lines
 
 
+# YAML read/write, with a pickled sidecar cache
+def write_yaml(obj: object, path: str | Path, **kwargs) -> None:
+    """Write an object to a YAML file, along with a pickled sidecar
+
+    The sidecar is much faster to load than the YAML and is preferred by
+    `read_yaml` as long as it is up to date; the YAML remains the
+    human-readable source of truth
+
+    :param obj: The object to write
+    :param path: The path to the YAML file to write
+    """
+    yaml, _, dumper = _yaml()
+    path = Path(path)
+    path.write_text(yaml.dump(obj, Dumper=dumper, **kwargs))
+    path.with_suffix(".pkl").write_bytes(
+        pickle.dumps(obj, protocol=pickle.HIGHEST_PROTOCOL)
+    )
+
+
+def read_yaml(path: str | Path) -> object:
+    """Read an object from a YAML file, preferring its pickled sidecar
+
+    The sidecar is used when it is at least as new as the YAML file; otherwise
+    the YAML is parsed and the sidecar is regenerated
+
+    :param path: The path to the YAML file
+    :return: The object read from the file
+    """
+    path = Path(path)
+    pkl_path = path.with_suffix(".pkl")
+    if pkl_path.exists() and pkl_path.stat().st_mtime >= path.stat().st_mtime:
+        return pickle.loads(pkl_path.read_bytes())
+
+    yaml, loader, _ = _yaml()
+    obj = yaml.load(path.read_text(), Loader=loader)
+    pkl_path.write_bytes(pickle.dumps(obj, protocol=pickle.HIGHEST_PROTOCOL))
+    return obj
+
+
 # Task read/write
 def write_task_list(yaml_tasks: list[Task], path: str | Path) -> None:
     """Write a task list out in YAML format
@@ -544,9 +799,13 @@ def write_task_list(yaml_tasks: list[Task], path: str | Path) -> None:
     :param tasks: The list of tasks
     :param path: The path to the YAML file to write
     """
-    path = Path(path)
-    yaml_tasks = list(map(dataclasses.asdict, yaml_tasks))
-    path.write_text(yaml.safe_dump(yaml_tasks, default_flow_style=None))
+    # Gather the fields shallowly; dataclasses.asdict would deep-copy the
+    # subtask key/worker sequences, which the YAML dump does not need
+    yaml_tasks = [
+        {name: getattr(task, name) for name in TASK_FIELD_NAMES}
+        for task in yaml_tasks
+    ]
+    write_yaml(yaml_tasks, path, default_flow_style=None)
 
 
 def read_task_list(path: str | Path) -> list[Task]:
@@ -555,29 +814,43 @@ def read_task_list(path: str | Path) -> list[Task]:
     :param path: The path to the YAML file
     :return: The list of tasks
     """
-    path = Path(path)
-    yaml_tasks = yaml.safe_load(path.read_text())
-    return [Task(**d) for d in yaml_tasks]
+    yaml_tasks = read_yaml(path)
+    return [
+        Task(
+            **{
+                **d,
+                "subtask_keys": tuple(
+                    tuple(k) if isinstance(k, list) else k
+                    for k in d["subtask_keys"]
+                ),
+                "subtask_nworkers": tuple(d["subtask_nworkers"]),
+            }
+        )
+        for d in yaml_tasks
+    ]
 
 
 # Generic string formatting functions
+@functools.lru_cache(maxsize=256)
 def format_block(inp: str) -> str:
     """Format a block with nice indentation
 
     :param inp: A multiline string to be formatted
     :return: The formatted string
     """
-    inp = re.sub(r"^\ *", "", inp, flags=re.MULTILINE)
-    return textwrap.indent(inp, "    ")
+    # Re-indenting content lines and blanking whitespace-only lines in two
+    # precompiled substitutions replaces the old strip-then-textwrap.indent pair
+    return INDENT_REGEX.sub("    ", BLANK_LINE_REGEX.sub("", inp))
 
 
+@functools.lru_cache(maxsize=256)
 def without_comments(inp: str) -> str:
     """Get a CHEMKIN string or substring with comments removed.
 
     :param inp: A CHEMKIN mechanism, as a file path or string
     :return: The string, without comments
     """
-    return re.sub(COMMENT_REGEX, "", inp)
+    return COMMENT_REGEX.sub("", inp)
 
 
 def parse_index_series(inp: str) -> list[int]:
@@ -588,18 +861,14 @@ def parse_index_series(inp: str) -> list[int]:
         Input: '1,3, 5-9  \n  11,13-14\n23\n 27-29'
         Output: (1, 3, 5, 6, 7, 8, 9, 11, 13, 14, 23, 27, 28, 29)
     """
-    dash = pp.Suppress(pp.Literal("-"))
-    entry = ppc.integer ^ pp.Group(ppc.integer + dash + ppc.integer)
-    delim = pp.LineEnd() ^ pp.Literal(",")
-    expr = pp.DelimitedList(entry, delim=delim)
-    idxs = []
-    for res in expr.parseString(inp).as_list():
-        if isinstance(res, int):
-            idxs.append(res)
+    idxs = {}
+    for start, stop in INDEX_SERIES_REGEX.findall(inp):
+        if stop:
+            for idx in range(int(start), int(stop) + 1):
+                idxs[idx] = None
         else:
-            start, stop = res
-            idxs.extend(range(start, stop + 1))
-    return list(mit.unique_everseen(idxs))
+            idxs[int(start)] = None
+    return list(idxs)
 
 
 def block_expression(keyword: str, key: str = "content") -> pp.ParseExpression:
@@ -612,3 +881,27 @@ def block_expression(keyword: str, key: str = "content") -> pp.ParseExpression:
     start = pp.Keyword(keyword)
     end = pp.Keyword("end") + pp.Keyword(keyword)
     return pp.Suppress(... + start) + pp.SkipTo(end)(key) + pp.Suppress(end)
+
+
+# Prebuilt grammar singletons: pyparsing grammar construction is far more
+# expensive than parsing, so each expression is built once at import time
+_BLOCK_EXPRS = {
+    kw: block_expression(kw, key="content")
+    for kw in ("input", "pes", "spc", "els", "thermo", "kin", "level")
+}
+
+_THEORY_BLOCKS_EXPR = pp.OneOrMore(_BLOCK_EXPRS["level"])
+_THEORY_WORD = pp.Word(pp.printables)
+_THEORY_FIELD = pp.Group(
+    _THEORY_WORD("key") + pp.Suppress(pp.Literal("=")) + _THEORY_WORD("val")
+)
+_THEORY_BLOCK_EXPR = _THEORY_WORD("key") + pp.DelimitedList(
+    _THEORY_FIELD, delim=pp.LineEnd()
+)("fields")
+
+_PES_ENTRY = pp.Group(
+    ppc.integer("pes")
+    + pp.Suppress(pp.Literal(":"))
+    + pp.SkipTo(pp.FollowedBy(pp.LineEnd()))("channels")
+)
+_PES_EXPR = pp.DelimitedList(_PES_ENTRY, delim=pp.LineEnd())
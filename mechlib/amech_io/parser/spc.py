@@ -2,6 +2,7 @@
 """
 
 import copy
+import functools
 import automol
 import ioformat
 import mechanalyzer
@@ -467,6 +468,7 @@ def ts_dct_sing_chnl(pes_idx, reaction,
     return ts_dct
 
 
+@functools.lru_cache(maxsize=None)
 def base_tsname(pes_idx, chnl_idx):
     """ get tsname that precludes the confiuraton number
     """
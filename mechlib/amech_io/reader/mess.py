@@ -46,13 +46,21 @@ def rate_strings(rate_paths_dct):
     return rate_strs_dct, mess_paths_dct
 
 
+# Parsed pf.dat tables keyed by path and modification time, since the same
+# output is re-parsed when partition functions are combined in several ways
+_MESSPF_CACHE = {}
+
+
 def messpf(pf_path):
     """ Obtain the log partition functions from the MESSPF file
     """
-    # Read MESSPF file
+    # Read MESSPF file, parsing it once per write of the file
     messpf_file = os.path.join(pf_path, 'pf.dat')
-    with open(messpf_file, mode='r', encoding='utf-8') as pffile:
-        output_string = pffile.read()
-    temps, logq, dq_dt, dq2_dt2 = mess_io.reader.pfs.partition_function(
-        output_string)
+    key = (messpf_file, os.path.getmtime(messpf_file))
+    if key not in _MESSPF_CACHE:
+        with open(messpf_file, mode='r', encoding='utf-8') as pffile:
+            output_string = pffile.read()
+        _MESSPF_CACHE[key] = mess_io.reader.pfs.partition_function(
+            output_string)
+    temps, logq, dq_dt, dq2_dt2 = _MESSPF_CACHE[key]
     return temps, logq, dq_dt, dq2_dt2
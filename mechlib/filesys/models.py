@@ -21,30 +21,35 @@ def pf_rngs_filesys(spc_dct_i, spc_model_dct_i,
     """ Create various filesystems needed
     """
 
+    # Models frequently share a theory level across the harm/symm/tors/vpt2
+    # slots; memoize on the level so the locator search runs once per level
+    memo = {}
+
+    def _model_filesys(level):
+        key = tuple(level)
+        if key not in memo:
+            memo[key] = set_model_filesys(
+                spc_dct_i, level,
+                run_prefix, save_prefix, saddle, name=name, cnf_range='r100',
+                nprocs=nprocs)
+        return memo[key]
+
     pf_filesystems = {}
-    pf_filesystems['harm'] = set_model_filesys(
-        spc_dct_i, spc_model_dct_i['vib']['geolvl'][1][1],
-        run_prefix, save_prefix, saddle, name=name, cnf_range='r100',
-        nprocs=nprocs)
+    pf_filesystems['harm'] = _model_filesys(
+        spc_model_dct_i['vib']['geolvl'][1][1])
     if 'mod' in spc_model_dct_i['symm']:
-        pf_filesystems['symm'] = set_model_filesys(
-            spc_dct_i, spc_model_dct_i['symm']['geolvl'][1][1],
-            run_prefix, save_prefix, saddle, name=name, cnf_range='r100',
-            nprocs=nprocs)
+        pf_filesystems['symm'] = _model_filesys(
+            spc_model_dct_i['symm']['geolvl'][1][1])
     else:
         pf_filesystems['symm'] = None
     if spc_model_dct_i['tors']['mod'] != 'rigid':
-        pf_filesystems['tors'] = set_model_filesys(
-            spc_dct_i, spc_model_dct_i['tors']['geolvl'][1][1],
-            run_prefix, save_prefix, saddle, name=name, cnf_range='r100',
-            nprocs=nprocs)
+        pf_filesystems['tors'] = _model_filesys(
+            spc_model_dct_i['tors']['geolvl'][1][1])
     else:
         pf_filesystems['tors'] = None
     if spc_model_dct_i['vib']['mod'] == 'vpt2':
-        pf_filesystems['vpt2'] = set_model_filesys(
-            spc_dct_i, spc_model_dct_i['vib']['vpt2lvl'][1][1],
-            run_prefix, save_prefix, saddle, name=name, cnf_range='r100',
-            nprocs=nprocs)
+        pf_filesystems['vpt2'] = _model_filesys(
+            spc_model_dct_i['vib']['vpt2lvl'][1][1])
     else:
         pf_filesystems['vpt2'] = None
 
@@ -70,17 +75,28 @@ def pf_filesys(spc_dct_i, spc_model_dct_i,
     cnf_range = 'min'
     if spc_locs is not None:
         cnf_range = 'specified'
-    pf_filesystems['harm'] = set_model_filesys(
-        spc_dct_i, spc_model_dct_i['vib']['geolvl'][1][1],
-        run_prefix, save_prefix, saddle, name=name,
-        cnf_range=cnf_range, spc_locs=spc_locs,
-        nprocs=nprocs)
+
+    # Models frequently share a theory level across the harm/symm/tors/vpt2
+    # slots; memoize on the level and locators so the search runs once each
+    memo = {}
+
+    def _model_filesys(level, _cnf_range, _spc_locs):
+        key = (tuple(level), _cnf_range,
+               tuple(_spc_locs) if _spc_locs is not None else None)
+        if key not in memo:
+            memo[key] = set_model_filesys(
+                spc_dct_i, level,
+                run_prefix, save_prefix, saddle, name=name,
+                cnf_range=_cnf_range, spc_locs=_spc_locs,
+                nprocs=nprocs)
+        return memo[key]
+
+    pf_filesystems['harm'] = _model_filesys(
+        spc_model_dct_i['vib']['geolvl'][1][1], cnf_range, spc_locs)
     if 'symm' in spc_model_dct_i:
         if 'mod' in spc_model_dct_i['symm']:
-            pf_filesystems['symm'] = set_model_filesys(
-                spc_dct_i, spc_model_dct_i['symm']['geolvl'][1][1],
-                run_prefix, save_prefix, saddle, name=name,
-                cnf_range=cnf_range, spc_locs=spc_locs)
+            pf_filesystems['symm'] = _model_filesys(
+                spc_model_dct_i['symm']['geolvl'][1][1], cnf_range, spc_locs)
     if 'tors' in spc_model_dct_i:
         if 'mod' in spc_model_dct_i['tors']:
             if spc_model_dct_i['tors']['mod'] != 'rigid':
@@ -88,18 +104,15 @@ def pf_filesys(spc_dct_i, spc_model_dct_i,
                     spc_model_dct_i, spc_dct_i, pf_filesystems['harm'],
                     run_prefix, save_prefix, saddle=saddle, name=name)
                 if scan_locs is not None:
-                    pf_filesystems['tors'] = set_model_filesys(
-                        spc_dct_i, spc_model_dct_i['tors']['geolvl'][1][1],
-                        run_prefix, save_prefix, saddle, name=name,
-                        cnf_range='specified', spc_locs=scan_locs)
+                    pf_filesystems['tors'] = _model_filesys(
+                        spc_model_dct_i['tors']['geolvl'][1][1],
+                        'specified', scan_locs)
                 else:
                     pf_filesystems['tors'] = None
     if 'vib' in spc_model_dct_i:
         if spc_model_dct_i['vib']['mod'] in ['vpt2', 'fund']:
-            pf_filesystems['vpt2'] = set_model_filesys(
-                spc_dct_i, spc_model_dct_i['vib']['vpt2lvl'][1][1],
-                run_prefix, save_prefix, saddle, name=name,
-                cnf_range=cnf_range, spc_locs=spc_locs)
+            pf_filesystems['vpt2'] = _model_filesys(
+                spc_model_dct_i['vib']['vpt2lvl'][1][1], cnf_range, spc_locs)
     else:
         pf_filesystems['vpt2'] = None
 
@@ -1,6 +1,8 @@
 """ drivers for coordinate scans
 """
 import itertools
+from concurrent.futures import ThreadPoolExecutor
+
 import numpy
 from scipy.interpolate import CubicSpline
 from scipy.interpolate import Akima1DInterpolator
@@ -15,13 +17,29 @@ from mechlib.filesys._build import build_fs
 from mechlib.filesys.mincnf import min_energy_conformer_locators
 
 
+# Scan energies get re-read whenever the rotor potentials are rebuilt for the
+# same conformer (e.g., for the ZPVE and the partition-function strings), so
+# cache the reads, including the misses from the backstep coordinates
+_SCN_ENE_CACHE = {}
+
+
+def _scan_energy(scn_fs, locs, mod_tors_ene_info):
+    """ Read a scan-point energy through a cache of previous reads
+    """
+    key = (scn_fs[-1].path(locs), tuple(mod_tors_ene_info[1:4]))
+    if key not in _SCN_ENE_CACHE:
+        _SCN_ENE_CACHE[key] = energy(scn_fs, locs, mod_tors_ene_info)
+    return _SCN_ENE_CACHE[key]
+
+
 def potential(names, grid_vals, cnf_save_path,
               mod_tors_ene_info, ref_ene,
               constraint_dct,
               read_geom=False, read_grad=False,
               read_hess=False, read_zma=False,
               read_energy_backstep=True,
-              remove_bad_points=True):
+              remove_bad_points=True,
+              cached=False):
     """ Get the potential for a hindered rotor
     """
 
@@ -43,24 +61,46 @@ def potential(names, grid_vals, cnf_save_path,
         scn_fs = autofile.fs.scan(zma_path)
     else:
         scn_fs = autofile.fs.cscan(zma_path)
-    # Read the filesystem
-    for idx, vals in enumerate(grid_coords):
-
-        # Get angles in degrees for potential for now
-        vals_conv = tuple(val*phycon.RAD2DEG for val in vals)
+    _energy = _scan_energy if cached else energy
 
-        # Get locs for reading filesysten
-        locs = [names, vals]
+    def _read_point(idx):
+        """ Read all of the requested data for one grid point
+        """
+        locs = [names, grid_coords[idx]]
         back_locs = [names, back_coords[idx]]
         if constraint_dct is not None:
             locs = [constraint_dct] + locs
             back_locs = [constraint_dct] + back_locs
-        # print('path', scn_fs[-1].path(locs))
 
-        # Read values of interest
-        ene = energy(scn_fs, locs, mod_tors_ene_info)
+        ene = _energy(scn_fs, locs, mod_tors_ene_info)
+        back_ene = None
+        if read_energy_backstep:
+            back_ene = _energy(scn_fs, back_locs, mod_tors_ene_info)
+
+        dat_dct = {}
+        for key, read_flag in (('geometry', read_geom),
+                               ('gradient', read_grad),
+                               ('hessian', read_hess),
+                               ('zmatrix', read_zma)):
+            if read_flag:
+                fobj = getattr(scn_fs[-1].file, key)
+                dat_dct[key] = fobj.read(locs) if fobj.exists(locs) else None
+
+        return ene, back_ene, dat_dct, scn_fs[-1].path(locs)
+
+    # Read all of the grid points, overlapping the many small-file reads,
+    # then assemble the potential serially in grid order
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        point_rets = list(pool.map(_read_point, range(len(grid_coords))))
+
+    for idx, vals in enumerate(grid_coords):
+
+        # Get angles in degrees for potential for now
+        vals_conv = tuple(val*phycon.RAD2DEG for val in vals)
+
+        # Unpack values of interest
+        ene, back_ene, dat_dct, point_path = point_rets[idx]
         if read_energy_backstep:
-            back_ene = energy(scn_fs, back_locs, mod_tors_ene_info)
             step_ene = None
             if ene is not None:
                 if back_ene is not None:
@@ -85,30 +125,18 @@ def potential(names, grid_vals, cnf_save_path,
             pot[vals_conv] = (ene - ref_ene) * phycon.EH2KCAL
 
         if read_geom:
-            if scn_fs[-1].file.geometry.exists(locs):
-                geoms[vals_conv] = scn_fs[-1].file.geometry.read(locs)
-            else:
-                geoms[vals_conv] = None
+            geoms[vals_conv] = dat_dct['geometry']
 
         if read_grad:
-            if scn_fs[-1].file.gradient.exists(locs):
-                grads[vals_conv] = scn_fs[-1].file.gradient.read(locs)
-            else:
-                grads[vals_conv] = None
+            grads[vals_conv] = dat_dct['gradient']
 
         if read_hess:
-            if scn_fs[-1].file.hessian.exists(locs):
-                hessians[vals_conv] = scn_fs[-1].file.hessian.read(locs)
-            else:
-                hessians[vals_conv] = None
+            hessians[vals_conv] = dat_dct['hessian']
 
         if read_zma:
-            if scn_fs[-1].file.zmatrix.exists(locs):
-                zmas[vals_conv] = scn_fs[-1].file.zmatrix.read(locs)
-            else:
-                zmas[vals_conv] = None
+            zmas[vals_conv] = dat_dct['zmatrix']
 
-        paths[vals] = scn_fs[-1].path(locs)
+        paths[vals] = point_path
 
     # If potential has any terms that are not None, ID and remove bad points
     if remove_bad_points and len(names) == 1:
@@ -1,7 +1,7 @@
 """ es_runners
 """
 
-import numpy
+import math
 import automol
 import elstruct
 import autofile
@@ -260,24 +260,28 @@ def assess_pf_convergence(tau_save_fs, ref_ene,
     """ Determine how much the partition function has converged
     """
 
+    # Enumerate the saved samples and read their energies once; every
+    # temperature pass below reuses the same list
+    inf_obj_s = tau_save_fs[0].file.info.read()
+    nsamp = inf_obj_s.nsamp
+    saved_locs = list(tau_save_fs[-1].json_existing())
+    ratio = len(saved_locs) / float(nsamp)
+    eh2kcal = phycon.EH2KCAL
+    enes = [(tau_save_fs[-1].json.energy.read(locs) - ref_ene) * eh2kcal
+            for locs in saved_locs]
+
     # Calculate sigma values at various temperatures for the PF
     for temp in temps:
         sumq = 0.
         sum2 = 0.
         idx = 0
         debug_message('integral convergence for T = ', temp)
-        inf_obj_s = tau_save_fs[0].file.info.read()
-        nsamp = inf_obj_s.nsamp
-        saved_locs = tau_save_fs[-1].json_existing()
-        ratio = len(saved_locs) / float(nsamp)
-        for locs in saved_locs:
+        for ene in enes:
             idx += 1
-            ene = tau_save_fs[-1].json.energy.read(locs)
-            ene = (ene - ref_ene) * phycon.EH2KCAL
-            tmp = numpy.exp(-ene*349.7/(0.695*temp))
+            tmp = math.exp(-ene*349.7/(0.695*temp))
             sumq = sumq + tmp
             sum2 = sum2 + tmp**2
-            sigma = numpy.sqrt(
+            sigma = math.sqrt(
                 (abs(sum2/float(idx)-(sumq/float(idx))**2))/float(idx))
             debug_message(
                 sumq/float(idx), sigma, 100.*sigma*float(idx)/sumq, idx)
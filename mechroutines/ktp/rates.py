@@ -3,12 +3,13 @@ Write and Read MESS files for Rates
 """
 
 import importlib
-import copy
-import ioformat
+import os
+import re
+from concurrent.futures import ThreadPoolExecutor
 import automol
 import autorun
 import mess_io
-from mechlib.amech_io.parser.spc import tsnames_in_dct, base_tsname
+from mechlib.amech_io.parser.spc import base_tsname
 from mechlib.amech_io import reader
 from mechlib.amech_io import printer as ioprinter
 from mechlib import filesys
@@ -28,6 +29,9 @@ from mechroutines.ktp._multipes import set_hot_enes
 
 BLOCK_MODULE = importlib.import_module('mechroutines.models.blocks')
 
+# MESS-block writer functions already resolved from BLOCK_MODULE by name
+_WRITER_CACHE = {}
+
 
 # Create full string by writing the appropriate header, accounting for
 # (1) MESS Version and (2) Use of Well-Extension
@@ -63,6 +67,10 @@ def make_full_str(energy_trans_str, rxn_chan_str, dats,
     
     ioprinter.messpf('global_header')
 
+    # Determine the reaction type once; both header writers need it to
+    # decide on the well-extension keywords
+    is_abstraction = is_abstraction_pes(spc_dct, rxn_lst, pes_idx)
+
     # Write the header string
     if tsk_key_dct['mess_version'] == 'v1':
         _full_mess_v1(
@@ -71,9 +79,8 @@ def make_full_str(energy_trans_str, rxn_chan_str, dats,
             ped_spc_lst, hot_enes_dct,
             micro_out_params,
             float_type,
-            pes_mod_dct_i, spc_dct,
-            rate_paths_dct, pes_inf,
-            rxn_lst, pes_idx, tsk_key_dct)
+            pes_mod_dct_i, is_abstraction,
+            rate_paths_dct, pes_inf, tsk_key_dct)
     else:
         _full_mess_v2(
             energy_trans_str, rxn_chan_str, dats,
@@ -81,9 +88,8 @@ def make_full_str(energy_trans_str, rxn_chan_str, dats,
             ped_spc_lst, hot_enes_dct,
             micro_out_params,
             float_type,
-            pes_mod_dct_i, spc_dct,
-            rate_paths_dct, pes_inf,
-            rxn_lst, pes_idx)
+            pes_mod_dct_i, is_abstraction,
+            rate_paths_dct, pes_inf)
 
     return pes_param_dct
 
@@ -93,12 +99,11 @@ def _full_mess_v1(energy_trans_str, rxn_chan_str, dats,
                   ped_spc_lst, hot_enes_dct,
                   micro_out_params,
                   float_type,
-                  pes_mod_dct_i, spc_dct,
-                  rate_paths_dct, pes_inf,
-                  rxn_lst, pes_idx, tsk_key_dct):
+                  pes_mod_dct_i, is_abstraction,
+                  rate_paths_dct, pes_inf, tsk_key_dct):
     """ Make the global header string for MESS version 1
 
-        last line of arguments only used to determine well-extension
+        is_abstraction used to determine well-extension
     """
 
     ioprinter.debug_message(
@@ -108,10 +113,10 @@ def _full_mess_v1(energy_trans_str, rxn_chan_str, dats,
         'CalculationMethod, WellCutoff, ' +
         'ReductionMethod, AtomDistanceMin')
 
-    is_abstraction = is_abstraction_pes(spc_dct, rxn_lst, pes_idx)
-    if is_abstraction and tsk_key_dct['well_extension']:
+    well_extension = tsk_key_dct['well_extension']
+    if is_abstraction and well_extension:
         well_extend = None # overwrite
-    elif not is_abstraction and tsk_key_dct['well_extension']:
+    elif not is_abstraction and well_extension:
         well_extend = 0.001
     else:
         well_extend = None
@@ -146,14 +151,12 @@ def _full_mess_v1(energy_trans_str, rxn_chan_str, dats,
     base_mess_path = rate_paths_dct[pes_inf]['base-v1']
     ioprinter.obj('line_plus')
     ioprinter.writing('MESS input file', base_mess_path)
-    ioprinter.debug_message('MESS Input:\n\n'+mess_inp_str)
-    autorun.write_input(
-        base_mess_path, mess_inp_str,
-        aux_dct=dats, input_name='mess.inp')
+    ioprinter.debug_message('MESS Input:\n', mess_inp_str)
+    _write_input_bulk(base_mess_path, mess_inp_str, dats)
 
 
     # Write the second MESS string (well extended), if needed
-    if not is_abstraction and tsk_key_dct['well_extension']:
+    if not is_abstraction and well_extension:
         print('User requested well extension scheme for rates...')
 
         # Run the base MESSRATE
@@ -171,23 +174,19 @@ def _full_mess_v1(energy_trans_str, rxn_chan_str, dats,
         wext_t = pes_mod_dct_i['well_extension_temp']
 
         print('  - Setting up the well-extended MESSRATE input')
-        wext_mess_inp_str_nolump = mess_io.well_lumped_input_file(
-            rate_strs_dct[pes_inf]['base-v1']['inp'],
-            rate_strs_dct[pes_inf]['base-v1']['ktp_out'],
-            rate_strs_dct[pes_inf]['base-v1']['aux'],
-            rate_strs_dct[pes_inf]['base-v1']['log'],
-            wext_p,
-            wext_t, lump = False)
-
-        base_mess_path = rate_paths_dct[pes_inf]['base-v1']
+        wext_mess_inp_str_nolump, wext_mess_inp_str = _well_extended_inp_strs(
+            rate_strs_dct[pes_inf]['base-v1'], wext_p, wext_t)
+
         ioprinter.obj('line_plus')
         ioprinter.writing('New Well-Extended MESS input file '
                           f'at path {base_mess_path}')
         print('  - Warning, old base input overwritten.')
-        ioprinter.debug_message('MESS Input:\n\n'+wext_mess_inp_str_nolump)
+        ioprinter.debug_message('MESS Input:\n', wext_mess_inp_str_nolump)
+        # The aux files written with the base input above are unchanged,
+        # so only the input file itself needs overwriting here
         autorun.write_input(
             base_mess_path, wext_mess_inp_str_nolump,
-            aux_dct=dats, input_name='mess.inp')
+            aux_dct=None, input_name='mess.inp')
         
         print(f'  - Running MESS base job at path {base_mess_path}')
         print('  - Warning, old base results overwritten.')
@@ -195,35 +194,107 @@ def _full_mess_v1(energy_trans_str, rxn_chan_str, dats,
         
         print('  - Setting up the well-extended MESSRATE input with')
         print(f'   lumping/extension Scheme for P={wext_p} atm, T={wext_t} K')
-        wext_mess_inp_str = mess_io.well_lumped_input_file(
-            rate_strs_dct[pes_inf]['base-v1']['inp'],
-            rate_strs_dct[pes_inf]['base-v1']['ktp_out'],
-            rate_strs_dct[pes_inf]['base-v1']['aux'],
-            rate_strs_dct[pes_inf]['base-v1']['log'],
-            wext_p,
-            wext_t)
 
         wext_mess_path = rate_paths_dct[pes_inf]['wext-v1']
         ioprinter.obj('line_plus')
         ioprinter.writing('New Well-Extended MESS input file '
                           f'at path {wext_mess_path}')
-        ioprinter.debug_message('MESS Input:\n\n'+wext_mess_inp_str)
+        ioprinter.debug_message('MESS Input:\n', wext_mess_inp_str)
+        _write_input_linked_dats(
+            wext_mess_path, wext_mess_inp_str, dats, base_mess_path)
+
+def _write_input_bulk(mess_path, mess_inp_str, dats):
+    """ Write a MESS input file and its auxiliary data files, writing
+        the aux files concurrently.
+
+        A PES can carry dozens of small flux/MDHR/SCT files, whose write
+        cost is dominated by per-file syscalls; the threads overlap them.
+
+        :param mess_path: path to write the MESS input at
+        :type mess_path: str
+        :param mess_inp_str: MESS input file string
+        :type mess_inp_str: str
+        :param dats: auxiliary data files, as {file name: file string}
+        :type dats: dict[str: str]
+    """
+    autorun.write_input(
+        mess_path, mess_inp_str, aux_dct=None, input_name='mess.inp')
+
+    def _write(item):
+        name, dat_str = item
+        if dat_str:
+            with open(os.path.join(mess_path, name), mode='w',
+                      errors='ignore') as dat_file:
+                dat_file.write(dat_str)
+
+    if dats:
+        with ThreadPoolExecutor(max_workers=4) as pool:
+            tuple(pool.map(_write, dats.items()))
+
+
+def _write_input_linked_dats(mess_path, mess_inp_str, dats, dats_src_path):
+    """ Write a MESS input file, hard-linking its auxiliary data files
+        from a directory where identical copies were already written
+        instead of re-writing their contents.
+
+        Falls back to writing the files in full if linking is not
+        possible (e.g. the paths are on different filesystems).
+
+        :param mess_path: path to write the MESS input at
+        :type mess_path: str
+        :param mess_inp_str: MESS input file string
+        :type mess_inp_str: str
+        :param dats: auxiliary data files, as {file name: file string}
+        :type dats: dict[str: str]
+        :param dats_src_path: path where the aux files are already written
+        :type dats_src_path: str
+    """
+    try:
         autorun.write_input(
-            wext_mess_path, wext_mess_inp_str,
-            aux_dct=dats, input_name='mess.inp')
+            mess_path, mess_inp_str, aux_dct=None, input_name='mess.inp')
+        for name in dats or {}:
+            src = os.path.join(dats_src_path, name)
+            dst = os.path.join(mess_path, name)
+            if os.path.exists(dst):
+                os.remove(dst)
+            os.link(src, dst)
+    except OSError:
+        autorun.write_input(
+            mess_path, mess_inp_str, aux_dct=dats, input_name='mess.inp')
+
+
+def _well_extended_inp_strs(base_strs_dct, wext_p, wext_t):
+    """ Build the non-lumped and lumped well-extended MESS input strings
+        from the output of a base MESSRATE job.
+
+        Both variants come from the same base job strings, so they are
+        generated together from a single set of reads rather than
+        re-marshalling the (large) input/output strings for each call.
+
+        :param base_strs_dct: inp/ktp_out/aux/log strings of the base job
+        :type base_strs_dct: dict[str: str]
+        :rtype: (str, str)
+    """
+    inp_str = base_strs_dct['inp']
+    ktp_out_str = base_strs_dct['ktp_out']
+    aux_str = base_strs_dct['aux']
+    log_str = base_strs_dct['log']
+    args = (inp_str, ktp_out_str, aux_str, log_str, wext_p, wext_t)
+    return (mess_io.well_lumped_input_file(*args, lump=False),
+            mess_io.well_lumped_input_file(*args))
+
 
 def _full_mess_v2(energy_trans_str, rxn_chan_str, dats,
                   temps, pressures,
                   ped_spc_lst, hot_enes_dct,
                   micro_out_params,
                   float_type,
-                  pes_mod_dct_i, spc_dct,
-                  rate_paths_dct, pes_inf,
-                  rxn_lst, pes_idx):
+                  pes_mod_dct_i, is_abstraction,
+                  rate_paths_dct, pes_inf):
     """ Make the global header string for MESS version 2
     """
 
-    if is_abstraction_pes(spc_dct, rxn_lst, pes_idx):
+    if is_abstraction:
         well_extend = None
     else:
         well_extend = 0.001
@@ -257,10 +328,8 @@ def _full_mess_v2(energy_trans_str, rxn_chan_str, dats,
     base_mess_path = rate_paths_dct[pes_inf]['base-v2']
     ioprinter.obj('line_plus')
     ioprinter.writing('MESS input file', base_mess_path)
-    ioprinter.debug_message('MESS Input:\n\n'+mess_inp_str)
-    autorun.write_input(
-        base_mess_path, mess_inp_str,
-        aux_dct=dats, input_name='mess.inp')
+    ioprinter.debug_message('MESS Input:\n', mess_inp_str)
+    _write_input_bulk(base_mess_path, mess_inp_str, dats)
 
 
 def make_global_etrans_str(rxn_lst, spc_dct, etrans_dct):
@@ -305,7 +374,7 @@ def make_pes_mess_str(spc_dct, rxn_lst, pes_idx, pesgrp_num,
     basis_energy_dct = {}
     basis_energy_dct[spc_model] = {}
 
-    full_well_str, full_bi_str, full_ts_str = '', '', ''
+    well_str_lst, bi_str_lst, ts_str_lst = [], [], []
     full_dat_str_dct = {}
 
     # Set the energy and model for the first reference species
@@ -317,10 +386,53 @@ def make_pes_mess_str(spc_dct, rxn_lst, pes_idx, pesgrp_num,
         run_prefix, save_prefix, ref_idx=0, nprocs=nprocs)
     basis_energy_dct[spc_model].update(model_basis_energy_dct)
 
+    # Index all of the TS configuration names for the PES up front, rather
+    # than rescanning the full species dictionary for every channel
+    ts_names_dct = _ts_names_by_channel(spc_dct, pes_idx)
+
+    # Conformer-sorting info is a pure function of PES-level inputs,
+    # so determine it once here rather than once per channel
+    cnf_range = tsk_key_dct['cnf_range']
+    sort_info_lst = filesys.mincnf.sort_info_lst(tsk_key_dct['sort'], thy_dct)
+
+    # Conformer locators for a given species are the same on every channel
+    # it appears in; share them across the channel reads
+    spc_locs_cache = {}
+
+    # Read the save filesys data for all of the channels concurrently;
+    # the reads are I/O-bound and independent across channels. Each worker
+    # gets its own copy of the basis energy dict, which is merged back in
+    # channel order below so the final dict matches a serial run
+    def _read_channel(rxn):
+        chnl_idx, (reacs, prods) = rxn
+        tsname_allconfigs = ts_names_dct.get(chnl_idx, ())
+        return get_channel_data(
+            reacs, prods, tsname_allconfigs,
+            spc_dct, cnf_range, sort_info_lst,
+            dict(basis_energy_dct[spc_model]),
+            pes_model_dct_i, spc_model_dct_i,
+            run_prefix, save_prefix, nprocs=nprocs,
+            spc_locs_cache=spc_locs_cache)
+
+    with ThreadPoolExecutor(max_workers=max(nprocs, 1)) as pool:
+        chnl_data_lst = list(pool.map(_read_channel, rxn_lst))
+
+    # Generate the auxiliary SMILES labels once per PES; the InChI->SMILES
+    # conversions are pure and species recur across channels. A flat
+    # name -> InChI index is built first so the nested spc_dct walks
+    # happen once per unique species
+    pes_spc_names = {name for _, rgts in rxn_lst
+                     for side in rgts for name in side}
+    inchi_dct = {name: spc_dct[name]['inchi'] for name in pes_spc_names}
+    smiles_dct = {name: automol.chi.smiles(ich)
+                  for name, ich in inchi_dct.items()}
+
     # Loop over all the channels and write the MESS strings
-    written_labels = []
+    # Species MESS blocks are cached since species recur across channels
+    spc_str_cache = {}
+    written_labels = set()
     hot_enes_dct = {}
-    for rxn in rxn_lst:
+    for rxn, chnl_data in zip(rxn_lst, chnl_data_lst):
 
         chnl_idx, (reacs, prods) = rxn
 
@@ -330,13 +442,8 @@ def make_pes_mess_str(spc_dct, rxn_lst, pes_idx, pesgrp_num,
 
         # Get the names for all of the configurations of the TS
         tsname = base_tsname(pes_idx, chnl_idx)
-        tsname_allconfigs = tsnames_in_dct(pes_idx, chnl_idx, spc_dct)
-        chnl_infs, chn_basis_ene_dct = get_channel_data(
-            reacs, prods, tsname_allconfigs,
-            spc_dct, tsk_key_dct,
-            basis_energy_dct[spc_model],
-            thy_dct, pes_model_dct_i, spc_model_dct_i,
-            run_prefix, save_prefix, nprocs=nprocs)
+        rclass = spc_dct[tsname+'_0']['class']
+        chnl_infs, chn_basis_ene_dct = chnl_data
 
         basis_energy_dct[spc_model].update(chn_basis_ene_dct)
 
@@ -350,21 +457,27 @@ def make_pes_mess_str(spc_dct, rxn_lst, pes_idx, pesgrp_num,
 
         # Write the mess strings for all spc on the channel
         mess_strs, dat_str_dct, written_labels = _make_channel_mess_strs(
-            tsname, reacs, prods, pesgrp_num,
+            tsname, rclass, reacs, prods, pesgrp_num,
             spc_dct, label_dct, written_labels,
             pes_param_dct, chnl_infs, chnl_enes, spc_model_dct_i,
+            spc_str_cache, smiles_dct,
             unstable_chnl=(chnl_idx in unstable_chnls))
 
         # Append to full MESS strings
         [well_str, bi_str, ts_str] = mess_strs
-        full_well_str += well_str
-        full_bi_str += bi_str
-        full_ts_str += ts_str
+        well_str_lst.append(well_str)
+        bi_str_lst.append(bi_str)
+        ts_str_lst.append(ts_str)
         full_dat_str_dct.update(dat_str_dct)
 
-    # Combine all the reaction channel strings; remove empty lines
-    rxn_chan_str = '\n'.join([full_well_str, full_bi_str, full_ts_str])
-    rxn_chan_str = ioformat.remove_empty_lines(rxn_chan_str)
+    # Combine all the reaction channel strings, dropping the empty lines
+    # in the same pass instead of rescanning the fully joined string
+    lines = []
+    for str_lst in (well_str_lst, bi_str_lst, ts_str_lst):
+        for chunk in str_lst:
+            lines.extend(
+                line for line in chunk.split('\n') if line.strip())
+    rxn_chan_str = '\n'.join(lines)
 
     if not hot_enes_dct:
         hot_enes_dct = None
@@ -372,10 +485,30 @@ def make_pes_mess_str(spc_dct, rxn_lst, pes_idx, pesgrp_num,
     return rxn_chan_str, full_dat_str_dct, hot_enes_dct
 
 
-def _make_channel_mess_strs(tsname, reacs, prods, pesgrp_num,
+def _ts_names_by_channel(spc_dct, pes_idx):
+    """ Index the names of all TS configurations on a PES by channel index,
+        using a single pass over the species dictionary. Preserves the
+        name matching and ordering of parser.spc.tsnames_in_dct.
+
+        :param spc_dct: species dictionary
+        :type spc_dct: dict[]
+        :param pes_idx: index for the PES
+        :type pes_idx: int
+        :rtype: dict[int: tuple(str)]
+    """
+    ts_ptt = re.compile(rf'ts_{pes_idx+1:d}_(\d+)_')
+    names_dct = {}
+    for name in spc_dct:
+        match = ts_ptt.search(name)
+        if match is not None:
+            names_dct.setdefault(int(match.group(1))-1, []).append(name)
+    return {idx: tuple(names) for idx, names in names_dct.items()}
+
+
+def _make_channel_mess_strs(tsname, rclass, reacs, prods, pesgrp_num,
                             spc_dct, label_dct, written_labels,
                             pes_param_dct, chnl_infs, chnl_enes,
-                            spc_model_dct_i,
+                            spc_model_dct_i, spc_str_cache, smiles_dct,
                             unstable_chnl=False):
     """ For each reaction channel on the PES: take all of the pre-read and
         pre-processed information from the save filesys for the
@@ -386,12 +519,13 @@ def _make_channel_mess_strs(tsname, reacs, prods, pesgrp_num,
         Also returns dictionary for all additional auxiliary data files,
         formatted as {file name: file string}, required by MESS.
 
-        List of labels corresponding to MESS strings that have already been
+        Set of labels corresponding to MESS strings that have already been
         written and added to master string, meaning that species string does
         not need to be written again. Required since species appear on multiple
         channels.
 
         :param tsname: mechanism name of the transition state
+        :param rclass: reaction class of the transition state
         :param reacs: mechanisms name for the reactants of the reaction channel
         :type reacs: tuple(str)
         :param prods: mechanisms name for the products of the reaction channel
@@ -404,6 +538,10 @@ def _make_channel_mess_strs(tsname, reacs, prods, pesgrp_num,
         :type chnl_infs: dict[str:__]
         :param chnl_enes: energies for channel, relative to PES reference
         :type chnl_enes: dict[str:float]
+        :param spc_str_cache: species MESS blocks written on earlier channels
+        :type spc_str_cache: dict[(str, bool): (str, dict)]
+        :param smiles_dct: SMILES labels for all species on the PES
+        :type smiles_dct: dict[str: str]
         :rtype: (str, str, str), str, dict[str:str]
 
     """
@@ -422,16 +560,21 @@ def _make_channel_mess_strs(tsname, reacs, prods, pesgrp_num,
 
         # Build the species string for reactant(s)/product(s)
         # Skip molec string building for termolecular species (may need agn)
+        # Cache the blocks by name since a species recurs across channels;
+        # keyed on molecularity as well since the collated info (and thus
+        # the block) differs between the well and bimolecular cases
         spc_strs = []
         if len(rgt_names) < 3:
-            for inf in rgt_infs:
-                spc_str, dat_dct = _make_spc_mess_str(inf)
+            for name, inf in zip(rgt_names, rgt_infs):
+                cache_key = (name, len(rgt_names) == 1)
+                if cache_key not in spc_str_cache:
+                    spc_str_cache[cache_key] = _make_spc_mess_str(inf)
+                spc_str, dat_dct = spc_str_cache[cache_key]
                 spc_strs.append(spc_str)
                 full_dat_dct.update(dat_dct)
 
-        # Generate auxiliary labels corresponding to SMILES for quick IDs
-        aux_labels = tuple(automol.chi.smiles(spc_dct[name]['inchi'])
-                           for name in rgt_names)
+        # Auxiliary labels corresponding to SMILES for quick IDs
+        aux_labels = tuple(smiles_dct[name] for name in rgt_names)
 
         # old MESS channel labels system
         # Set the labels to put into the file
@@ -455,24 +598,27 @@ def _make_channel_mess_strs(tsname, reacs, prods, pesgrp_num,
         spc_labels = rgt_names+tuple()
 
         # always write as A+B
+        # Only one orientation of a label is ever written, so the reversed
+        # form only needs building when the forward one is unwritten
         _rxn_str = make_rxn_str(rgt_names)
-        _rxn_str_rev = make_rxn_str(rgt_names[::-1])
-        if _rxn_str_rev in written_labels:
-            chn_label = _rxn_str_rev
-        else:
+        if _rxn_str in written_labels:
             chn_label = _rxn_str
-
-        if any(lbl in written_labels for lbl in (_rxn_str, _rxn_str_rev)):
             write_string = False
         else:
-            write_string = True
+            _rxn_str_rev = make_rxn_str(rgt_names[::-1])
+            if _rxn_str_rev in written_labels:
+                chn_label = _rxn_str_rev
+                write_string = False
+            else:
+                chn_label = _rxn_str
+                write_string = True
 
         # Write the strings
         if write_string:
             # Append unwritten label to master list for future loops
 
             # Write appropriate string for Dummy, Bimol, Well
-            written_labels.append(chn_label)
+            written_labels.add(chn_label)
             if len(rgt_names) == 3:
                 aux_str = (
                     f'[{aux_labels[0]} + {aux_labels[1]} + {aux_labels[2]}]'
@@ -527,47 +673,55 @@ def _make_channel_mess_strs(tsname, reacs, prods, pesgrp_num,
     # For abstractions: Write MESS strings for fake reac and prod wells and TS
     if chnl_infs.get('fake_vdwr', None) is not None:
 
-        # Write all the MESS Strings for Fake Wells and TSs
-        fwell_str, fts_str, fake_lbl, fake_dct = _make_fake_mess_strs(
-            tsname, (reacs, prods), 'reacs', chnl_infs['fake_vdwr'],
-            chnl_enes, reac_label)
-
-        # Append the fake strings to overall strings
+        # Skip construction when the fake well was written on an earlier
+        # channel; its strings and aux data are already in the master
+        # strings, so only the inner TS label needs pointing at it
+        fake_lbl = make_rxn_str(reacs, prepend='FakeW-')
         if fake_lbl not in written_labels:
+
+            # Write all the MESS Strings for Fake Wells and TSs
+            fwell_str, fts_str, fake_lbl, fake_dct = _make_fake_mess_strs(
+                tsname, (reacs, prods), 'reacs', chnl_infs['fake_vdwr'],
+                chnl_enes, reac_label)
+
+            # Append the fake strings to overall strings
             well_str += fwell_str + '\n'
             ts_str += fts_str
-            written_labels.append(fake_lbl)
+            written_labels.add(fake_lbl)
+
+            # Update the data string dct if necessary
+            full_dat_dct.update(fake_dct)
 
         # Re-set the reactant label for the inner transition state
         inner_reac_label = fake_lbl
 
-        # Update the data string dct if necessary
-        full_dat_dct.update(fake_dct)
-
     if chnl_infs.get('fake_vdwp', None) is not None:
 
-        # Write all the MESS Strings for Fake Wells and TSs
-        fwell_str, fts_str, fake_lbl, fake_dct = _make_fake_mess_strs(
-            tsname, (reacs, prods), 'prods', chnl_infs['fake_vdwp'],
-            chnl_enes, prod_label)
-
-        # Append the fake strings to overall strings
+        # Skip construction when the fake well was written on an earlier
+        # channel, as above
+        fake_lbl = make_rxn_str(prods, prepend='FakeW-')
         if fake_lbl not in written_labels:
+
+            # Write all the MESS Strings for Fake Wells and TSs
+            fwell_str, fts_str, fake_lbl, fake_dct = _make_fake_mess_strs(
+                tsname, (reacs, prods), 'prods', chnl_infs['fake_vdwp'],
+                chnl_enes, prod_label)
+
+            # Append the fake strings to overall strings
             well_str += fwell_str + '\n'
             ts_str += fts_str
-            written_labels.append(fake_lbl)
+            written_labels.add(fake_lbl)
+
+            # Update the data string dct if necessary
+            full_dat_dct.update(fake_dct)
 
         # Reset the product labels for the inner transition state
         inner_prod_label = fake_lbl
 
-        # Update the data string dct if necessary
-        full_dat_dct.update(fake_dct)
-
     # Write MESS string for the inner transition state; append full
     # Label has to correspond only to base name (ignores configuration)
     # ts_label = label_dct[tsname]
     ts_label = tsname   # change MESS labels
-    rclass = spc_dct[tsname+'_0']['class']
     sts_str, ts_dat_dct = _make_ts_mess_str(
         chnl_infs, chnl_enes, spc_model_dct_i, rclass,
         ts_label, inner_reac_label, inner_prod_label,
@@ -592,7 +746,11 @@ def _make_spc_mess_str(inf_dct):
          :type inf_dct: dict[]
          :rtype: str
     """
-    mess_writer = getattr(BLOCK_MODULE, inf_dct['writer'])
+    writer_name = inf_dct['writer']
+    mess_writer = _WRITER_CACHE.get(writer_name)
+    if mess_writer is None:
+        mess_writer = getattr(BLOCK_MODULE, writer_name)
+        _WRITER_CACHE[writer_name] = mess_writer
     return mess_writer(inf_dct)
 
 
@@ -619,20 +777,31 @@ def _make_ts_mess_str(chnl_infs, chnl_enes, spc_model_dct_i, ts_class,
     # Unpack info objects
     ts_mod = spc_model_dct_i['ts']
 
-    # Write the initial data string and dat str dct with mdhr str
-    mess_strs = []
-    tunnel_strs = []
-    ts_dat_dct = {}
-    for idx, ts_inf_dct in enumerate(chnl_infs['ts']):
-
-        # Build initial data block
+    # Build the data block and tunneling string for a single configuration;
+    # the configurations are independent, so for variational/union TSs they
+    # are built concurrently (the block builders may read flux files)
+    def _config_strs(idx, ts_inf_dct):
         mstr, mdhr_dat, flux_dat = blocks.barrier_dat_block(
             ts_inf_dct, chnl_infs['reacs'], chnl_infs['prods'])
-
-        # Write the appropriate string for the tunneling model
         tunnel_str, sct_dct = tunnel.write_mess_tunnel_str(
             ts_inf_dct, chnl_enes, ts_mod, ts_class, idx,
             unstable_chnl=unstable_chnl)
+        return mstr, mdhr_dat, flux_dat, tunnel_str, sct_dct
+
+    if len(chnl_infs['ts']) > 1:
+        with ThreadPoolExecutor() as pool:
+            results = list(pool.map(
+                _config_strs,
+                range(len(chnl_infs['ts'])), chnl_infs['ts']))
+    else:
+        results = [_config_strs(idx, ts_inf_dct)
+                   for idx, ts_inf_dct in enumerate(chnl_infs['ts'])]
+
+    # Write the initial data string and dat str dct with mdhr str
+    mess_strs = []
+    tunnel_strs = []
+    ts_dat_dct = {}
+    for mstr, mdhr_dat, flux_dat, tunnel_str, sct_dct in results:
 
         # Update master TS list
         mess_strs.append(mstr)
@@ -720,9 +889,10 @@ def _make_fake_mess_strs(tsname, chnl, side, fake_inf_dcts,
     #     ioprinter.warning_message(f'No label {well_dct_key} in label dict')
 
     # New MESS label code
-    fake_well_label = make_rxn_str(chnl[side_idx], prepend='FakeW-')
+    side_rgts = chnl[side_idx]
+    fake_well_label = make_rxn_str(side_rgts, prepend='FakeW-')
     chn_idx = tsname.split('_')[2]  # ts_pesidx_chnidx_sadpt_idx
-    _side_str = '+'.join(chnl[side_idx])
+    _side_str = '+'.join(side_rgts)
     aux_str = f'Fake Well for {_side_str}'
     fake_well, well_dat = blocks.fake_species_block(*fake_inf_dcts)
     well_str += mess_io.writer.well(
@@ -744,7 +914,7 @@ def _make_fake_mess_strs(tsname, chnl, side, fake_inf_dcts,
 
     # New MESS label code (use channel index for PST barrier label)
     #pst_label = f'{prepend_key}{chn_idx}'
-    pst_label = make_rxn_str(chnl[side_idx], prepend='FakeB-')
+    pst_label = make_rxn_str(side_rgts, prepend='FakeB-')
     pst_ts_str, pst_ts_dat = blocks.pst_block(ts_inf_dct, *fake_inf_dcts)
     ts_str += '\n' + mess_io.writer.ts_sadpt(
         pst_label, side_label, fake_well_label, pst_ts_str,
@@ -763,10 +933,11 @@ def _make_fake_mess_strs(tsname, chnl, side, fake_inf_dcts,
 
 # Data Retriever Functions
 def get_channel_data(reacs, prods, tsname_allconfigs,
-                     spc_dct, tsk_key_dct,
+                     spc_dct, cnf_range, sort_info_lst,
                      model_basis_energy_dct,
-                     thy_dct, pes_model_dct_i, spc_model_dct_i,
-                     run_prefix, save_prefix, nprocs=1):
+                     pes_model_dct_i, spc_model_dct_i,
+                     run_prefix, save_prefix, nprocs=1,
+                     spc_locs_cache=None):
     """ For all species and transition state for the channel and
         read all required data from the save filesys, then process and
         format it to be able to write it into a MESS filesystem.
@@ -776,33 +947,50 @@ def get_channel_data(reacs, prods, tsname_allconfigs,
         :type reacs: tuple(str)
         :param prods: mechanisms name for the products of the reaction channel
         :type prods: tuple(str)
+        :param cnf_range: range of conformers to read
+        :param sort_info_lst: info for sorting the conformers
     """
 
     # Initialize the dict
     chnl_infs = {}
 
-    # Get the data for conformer sorting for reading the filesystem
-    cnf_range = tsk_key_dct['cnf_range']
-    sort_info_lst = filesys.mincnf.sort_info_lst(tsk_key_dct['sort'], thy_dct)
-
-    # Determine the MESS data for the reactants and products
-    # Gather data or set fake information for dummy reactants/products
-    chnl_infs['reacs'], chnl_infs['prods'] = [], []
-    for rgts, side in zip((reacs, prods), ('reacs', 'prods')):
-        _need_ene_trans = bool(len(rgts) == 1)
-        for rgt in rgts:
+    def _read_rgt(rgt, need_ene_trans):
+        """ Read the data for one reactant or product; workers run on a
+            snapshot of the basis energy dict, merged in order below
+        """
+        spc_locs_lst = None
+        if spc_locs_cache is not None:
+            spc_locs_lst = spc_locs_cache.get(rgt)
+        if spc_locs_lst is None:
             spc_locs_lst = filesys.models.get_spc_locs_lst(
                 spc_dct[rgt], spc_model_dct_i,
                 run_prefix, save_prefix, saddle=False,
                 cnf_range=cnf_range, sort_info_lst=sort_info_lst,
                 name=rgt, nprocs=nprocs)
-            chnl_infs_i, model_basis_energy_dct = build.read_spc_data(
-                spc_dct, rgt,
-                pes_model_dct_i, spc_model_dct_i,
-                run_prefix, save_prefix, model_basis_energy_dct,
-                calc_ene_trans=_need_ene_trans,
-                spc_locs=spc_locs_lst[0])
-            chnl_infs[side].append(chnl_infs_i)
+            if spc_locs_cache is not None:
+                spc_locs_cache[rgt] = spc_locs_lst
+        return build.read_spc_data(
+            spc_dct, rgt,
+            pes_model_dct_i, spc_model_dct_i,
+            run_prefix, save_prefix, dict(model_basis_energy_dct),
+            calc_ene_trans=need_ene_trans,
+            spc_locs=spc_locs_lst[0])
+
+    # Determine the MESS data for the reactants and products
+    # Gather data or set fake information for dummy reactants/products
+    # The per-species reads are independent filesystem walks; overlap them
+    rgt_jobs = []
+    for rgts, side in zip((reacs, prods), ('reacs', 'prods')):
+        _need_ene_trans = bool(len(rgts) == 1)
+        rgt_jobs.extend((side, rgt, _need_ene_trans) for rgt in rgts)
+
+    chnl_infs['reacs'], chnl_infs['prods'] = [], []
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        rgt_rets = list(pool.map(
+            lambda job: _read_rgt(job[1], job[2]), rgt_jobs))
+    for (side, _, _), (chnl_infs_i, basis_dct_i) in zip(rgt_jobs, rgt_rets):
+        chnl_infs[side].append(chnl_infs_i)
+        model_basis_energy_dct.update(basis_dct_i)
 
     # Get data for all configurations for a TS
     chnl_infs['ts'] = []
@@ -824,9 +1012,11 @@ def get_channel_data(reacs, prods, tsname_allconfigs,
     rwell_model = spc_model_dct_i['ts']['rwells']
     pwell_model = spc_model_dct_i['ts']['pwells']
     #rxn_class = spc_dct[tsname_allconfigs[0]]['class']  # no longer needed
+    # The fake wells only ever read from the info dicts, so a shallow copy
+    # of the list sharing them is enough
     if need_fake_wells(reacs, rwell_model):
-        chnl_infs['fake_vdwr'] = copy.deepcopy(chnl_infs['reacs'])
+        chnl_infs['fake_vdwr'] = list(chnl_infs['reacs'])
     if need_fake_wells(prods, pwell_model):
-        chnl_infs['fake_vdwp'] = copy.deepcopy(chnl_infs['prods'])
+        chnl_infs['fake_vdwp'] = list(chnl_infs['prods'])
 
     return chnl_infs, model_basis_energy_dct
@@ -48,15 +48,17 @@ def symmetry_factor(pf_filesystems, spc_mod_dct_i, spc_dct_i, rotors,
             # Obtain the external symssetry number
             ext_symm = automol.geom.external_symmetry_factor(geo)
 
-            # Set up the symmetry filesystem, read symmetrically similar geos
-            # includes minimum geo
-            sym_fs = fs.symmetry(cnf_path)
-            symm_geos = [geo]
-            symm_geos += [sym_fs[-1].file.geometry.read(locs)
-                          for locs in sym_fs[-1].existing()]
-
-            # Obtain the internal symmetry number and end group factors
+            # Obtain the internal symmetry number and end group factors;
+            # the symmetrically similar geometries are only needed when
+            # there are torsions to sample over, so only read them then
             if rotors is not None:
+                # Set up the symmetry filesystem, read symmetrically
+                # similar geos, includes minimum geo
+                sym_fs = fs.symmetry(cnf_path)
+                symm_geos = [geo]
+                symm_geos += [sym_fs[-1].file.geometry.read(locs)
+                              for locs in sym_fs[-1].existing()]
+
                 ioprinter.info_message(
                     ' - Determining internal sym number ',
                     'using sampling routine.')
@@ -119,7 +119,8 @@ def _read_potentials(rotors, spc_dct_i, run_path, cnf_save_path,
                 constraint_dct,
                 read_energy_backstep=True,
                 remove_bad_points=True,
-                read_geom=True)
+                read_geom=True,
+                cached=True)
 
             if pot:
                 pot_obj = automol.data.potent.from_dict(
@@ -144,7 +145,8 @@ def _read_potentials(rotors, spc_dct_i, run_path, cnf_save_path,
             read_grad=is_mdhrv,
             read_hess=is_mdhrv,
             read_energy_backstep=False,
-            remove_bad_points=True)
+            remove_bad_points=True,
+            cached=True)
 
         if is_mdhrv:
             script_str = autorun.SCRIPT_DCT['projrot']
@@ -208,6 +210,24 @@ def scale_rotor_pots(rotors, scale_factor=((), None), scale_override=None):
     return rotors
 
 
+# The z-matrix -> geometry conversion recurs whenever the hindered-rotor
+# strings are rebuilt (e.g., after the torsional potentials are rescaled);
+# key on object identity, holding the z-matrix so its id stays valid
+_GEO_CACHE = {}
+
+
+def _rotors_geometry(zma):
+    """ Convert the rotors' z-matrix to a geometry, caching the conversion
+    """
+    cached = _GEO_CACHE.get(id(zma))
+    if cached is None or cached[0] is not zma:
+        if len(_GEO_CACHE) > 128:
+            _GEO_CACHE.clear()
+        cached = (zma, automol.zmat.geometry(zma))
+        _GEO_CACHE[id(zma)] = cached
+    return cached[1]
+
+
 # FUNCTIONS TO WRITE STRINGS FOR THE ROTORS FOR VARIOUS SITUATION
 def make_hr_strings(rotors, mdhr_dct=None):
     """ Procedure for building the MESS strings
@@ -215,75 +235,83 @@ def make_hr_strings(rotors, mdhr_dct=None):
         :return mess_hr_str: all 1dhr strs
     """
 
-    # Initialize empty strings
-    mess_allr_str = ''
-    mess_hr_str, mess_flux_str, projrot_str = '', '', ''
+    # Initialize lists of string chunks, joined once at the end
+    mess_allr_lst = []
+    mess_hr_lst, mess_flux_lst, projrot_lst = [], [], []
     mdhr_dat = ''
 
     # Convert the rotor objects indexing to be in geoms
     zma = automol.data.rotor.rotors_zmatrix(rotors)
-    geo = automol.zmat.geometry(zma)
+    geo = _rotors_geometry(zma)
 
     # Get the number of rotors
     numrotors = len(rotors)
     for rotor in rotors:
         multirotor = automol.data.rotor.dimension(rotor)
 
+        # The potential is a rotor-level object; convert it to a dictionary
+        # once instead of per torsion
+        pot_dct = automol.data.potent.dict_(
+            automol.data.rotor.potential(rotor))
+
         for torsion in automol.data.rotor.torsions(rotor, key_typ="geom"):
 
             # Write the rotor strings
-            hr_str, ir_str, flux_str, prot_str = _tors_strs(torsion, rotor, geo)
-            # mess_allr_str += hr_str
-            mess_hr_str += hr_str
-            mess_flux_str += flux_str
-            projrot_str += prot_str
+            hr_str, ir_str, flux_str, prot_str = _tors_strs(
+                torsion, pot_dct, geo)
+            mess_hr_lst.append(hr_str)
+            mess_flux_lst.append(flux_str)
+            projrot_lst.append(prot_str)
 
             # For MDHR, add the appropriate string
             if mdhr_dct is not None:
                 if ((numrotors > 1 and multirotor) or numrotors == 1):
-                    mess_allr_str += ir_str
+                    mess_allr_lst.append(ir_str)
                 else:
-                    mess_allr_str += hr_str
+                    mess_allr_lst.append(hr_str)
             else:
-                mess_allr_str += hr_str
+                mess_allr_lst.append(hr_str)
 
     # Write the mdhr dat string
     if mdhr_dct is not None:
         mdhr_dat = mess_io.writer.mdhr_data(
             mdhr_dct['pot'], freqs=mdhr_dct['freqs'], nrot=numrotors)
 
-    return mess_allr_str, mess_hr_str, mess_flux_str, projrot_str, mdhr_dat
+    return (''.join(mess_allr_lst), ''.join(mess_hr_lst),
+            ''.join(mess_flux_lst), ''.join(projrot_lst), mdhr_dat)
 
 
-def _tors_strs(torsion, rotor, geo):
+def _tors_strs(torsion, pot_dct, geo):
     """ Gather the 1DHR torsional data and gather them into a MESS file
     """
-    pot = automol.data.rotor.potential(rotor)
-    pot_dct = automol.data.potent.dict_(pot)
+    group = automol.data.tors.groups(torsion)[0]
+    axis = automol.data.tors.axis(torsion)
+    symmetry = automol.data.tors.symmetry(torsion)
+    name = automol.data.tors.name(torsion)
 
     mess_hr_str = mess_io.writer.rotor_hindered(
-        group=automol.data.tors.groups(torsion)[0],
-        axis=automol.data.tors.axis(torsion),
-        symmetry=automol.data.tors.symmetry(torsion),
+        group=group,
+        axis=axis,
+        symmetry=symmetry,
         potential=pot_dct,
         hmin=None,
         hmax=None,
         lvl_ene_max=None,
         therm_pow_max=None,
         geo=geo,
-        rotor_id=automol.data.tors.name(torsion))
+        rotor_id=name)
 
     mess_ir_str = mess_io.writer.rotor_internal(
-        group=automol.data.tors.groups(torsion)[0],
-        axis=automol.data.tors.axis(torsion),
-        symmetry=automol.data.tors.symmetry(torsion),
+        group=group,
+        axis=axis,
+        symmetry=symmetry,
         grid_size=50,
         mass_exp_size=5,
         pot_exp_size=11,
         hmin=13,
         hmax=101,
         geo=None,
-        rotor_id=automol.data.tors.name(torsion))
+        rotor_id=name)
 
     # This is an ugly fix for if the D# torsion in the zmat was
     # defined with a dummy atom, now it redefines it relative
@@ -308,8 +336,8 @@ def _tors_strs(torsion, rotor, geo):
         span=automol.data.tors.span(torsion))
 
     projrot_str = projrot_io.writer.rotors(
-        axis=automol.data.tors.axis(torsion),
-        group=automol.data.tors.groups(torsion)[0])
+        axis=axis,
+        group=group)
 
     return mess_hr_str, mess_ir_str, mess_flux_str, projrot_str
 
@@ -23,7 +23,7 @@ import itertools
 
 def full_vib_analysis(
         spc_dct_i, pf_filesystems, spc_mod_dct_i,
-        run_prefix, zrxn=None):
+        run_prefix, zrxn=None, read_disps=False):
     """ process to get freq
     """
     # Pack into big object to pass into functions and return
@@ -57,7 +57,7 @@ def full_vib_analysis(
         [_, hr_str, _, prot_str, _] = tors_strs
         ret = tors_projected_freqs(
             pf_filesystems, hr_str, prot_str, run_prefix,
-            zrxn=zrxn, zma_locs=zma_locs)
+            zrxn=zrxn, zma_locs=zma_locs, read_disps=read_disps)
 
         if ret is not None:
             proj_hfreqs, unproj_hfreqs, tors_freqs, imag, disps = ret
@@ -87,7 +87,7 @@ def full_vib_analysis(
             unproj_ffreqs = ()
     else:
         ret = read_harmonic_freqs(
-            pf_filesystems, run_prefix, zrxn=zrxn)
+            pf_filesystems, run_prefix, zrxn=zrxn, read_disps=read_disps)
         if ret is not None:
             proj_hfreqs, imag, _, disps = ret
             unproj_hfreqs = proj_hfreqs
@@ -133,17 +133,44 @@ def full_vib_analysis(
 
 
 # Read the Frequencies from the filesystem using the fs objs
-def read_harmonic_freqs(pf_filesystems, run_prefix, zrxn=None):
+def read_harmonic_freqs(pf_filesystems, run_prefix, zrxn=None,
+                        read_disps=False):
     """ Read the harmonic frequencies for the minimum
         energy conformer
     """
     # Get the harmonic filesys information
     [cnf_fs, _, min_cnf_locs, _, _] = pf_filesystems['harm']
     return read_locs_harmonic_freqs(
-        cnf_fs, min_cnf_locs, run_prefix, zrxn=zrxn)
+        cnf_fs, min_cnf_locs, run_prefix, zrxn=zrxn, read_disps=read_disps)
+
+
+# The ProjRot analysis is deterministic for a stored geometry/Hessian pair
+# and recurs whenever a conformer shows up again (other channels, fake wells,
+# the ZPVE pass), so cache the result per conformer path
+_HARM_FREQ_CACHE = {}
 
 
-def read_locs_harmonic_freqs(cnf_fs, cnf_locs, run_prefix, zrxn=None):
+def read_locs_harmonic_freqs(cnf_fs, cnf_locs, run_prefix, zrxn=None,
+                             read_disps=False):
+    """ Read the harmonic frequencies for a specific conformer,
+        caching the ProjRot analysis per conformer
+    """
+    key = None
+    if cnf_locs is not None:
+        key = (cnf_fs[-1].path(cnf_locs), zrxn is not None, read_disps)
+        if key in _HARM_FREQ_CACHE:
+            return _HARM_FREQ_CACHE[key]
+
+    ret = _read_locs_harmonic_freqs(
+        cnf_fs, cnf_locs, run_prefix, zrxn=zrxn, read_disps=read_disps)
+    if key is not None and ret is not None:
+        _HARM_FREQ_CACHE[key] = ret
+
+    return ret
+
+
+def _read_locs_harmonic_freqs(cnf_fs, cnf_locs, run_prefix, zrxn=None,
+                              read_disps=False):
     """ Read the harmonic frequencies for a specific conformer
         Do the freqs obtain for two species for fake and pst?
     """
@@ -181,9 +208,12 @@ def read_locs_harmonic_freqs(cnf_fs, cnf_locs, run_prefix, zrxn=None):
         freqs, _, imag_freqs, _ = autorun.projrot.frequencies(
             script_str, vib_path, [geo], [[]], [hess])
 
-        # Obtain the displacements
-        norm_coord_str, _ = autorun.projrot.displacements(
-            script_str, vib_path, [geo], [[]], [hess])
+        # Obtain the displacements, which cost a second ProjRot run, only
+        # when the caller asks for them
+        norm_coord_str = None
+        if read_disps:
+            norm_coord_str, _ = autorun.projrot.displacements(
+                script_str, vib_path, [geo], [[]], [hess])
 
         # Calculate the zpve
         ioprinter.frequencies(freqs)
@@ -226,7 +256,8 @@ def read_anharmon_matrix(pf_filesystems):
 
 
 def tors_projected_freqs(pf_filesystems, mess_hr_str, projrot_hr_str,
-                         prefix, zrxn=None, conf=None, zma_locs=None):
+                         prefix, zrxn=None, conf=None, zma_locs=None,
+                         read_disps=False):
     """ Get the projected frequencies from harmonic frequencies,
         which requires projrot run
 
@@ -265,10 +296,13 @@ def tors_projected_freqs(pf_filesystems, mess_hr_str, projrot_hr_str,
         dist_cutoff_dct2=dist_cutoff_dct2,
         saddle=(zrxn is not None))
 
-    # Obtain the displacements
-    disp_path = os.path.join(vib_path, 'DISP')
-    harm_disps = autorun.projrot.displacements(
-        projrot_script_str, disp_path, [harm_geo], [[]], [hess])
+    # Obtain the displacements, which cost a second ProjRot run, only
+    # when the caller asks for them
+    harm_disps = None
+    if read_disps:
+        disp_path = os.path.join(vib_path, 'DISP')
+        harm_disps = autorun.projrot.displacements(
+            projrot_script_str, disp_path, [harm_geo], [[]], [hess])
 
     proj_freqs, proj_imag, _, harm_freqs, tors_freqs = proj_inf
 
@@ -478,11 +512,10 @@ def compute_lambda(freqs, xmat, temp=298.15):
             0.69503476*float(temp)*float(x_ij)) / (float(w_i)*float(w_j))
 
     length = min(len(freqs), len(xmat))
-    lambda_mat = numpy.zeros((length, length))
-    for i in range(length):
-        for j in range(length):
-            lambda_mat[i][j] = _lambda_ij(
-                freqs[i], freqs[j], xmat[i][j], temp)
+    lambda_mat = numpy.array(
+        [[_lambda_ij(freqs[i], freqs[j], xmat[i][j], temp)
+          for j in range(length)]
+         for i in range(length)])
     return lambda_mat
 
 
@@ -540,15 +573,12 @@ def anharm_freqs(freqs, xmat):
     OUTPUT:
     anharms - VPT2 anharmonic frequencies
     """
-    anharms = numpy.zeros(len(freqs))
+    anharms = []
     for i, freq in enumerate(freqs):
-        anharms[i] = freq
-        anharms[i] += 2. * xmat[i][i]
-        tmp = 0
-        for j in range(len(freqs)):
-            if j != i:
-                tmp += xmat[i][j]
-        anharms[i] += 1./2 * tmp
+        anharm = freq + 2. * xmat[i][i]
+        anharm += 1./2 * sum(
+            xmat[i][j] for j in range(len(freqs)) if j != i)
+        anharms.append(anharm)
     return tuple(anharms)
 
 
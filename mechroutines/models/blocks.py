@@ -363,19 +363,13 @@ def rpvtst_block(ts_inf_dct, inf_dct_i, inf_dct_j):
     rpath_strs = []
     for idx, dct in enumerate(ts_inf_dct['rpath']):
 
-        # Iniialize the header of the rxn path pt string
-        rpath_str = '!-----------------------------------------------\n'
-        rpath_str += f'! Rxn Path Pt {str(idx+1)}: '
-        rpath_str += f'R = {dct["rval"]*phycon.BOHR2ANG:.2f} Ang'
-        rpath_str += '\n\n'
-
-        # Write MESS string for the rxn path pt; add to rxn path pt string
+        # Write MESS string for the rxn path pt
         core_str = mess_io.writer.core_rigidrotor(
             geo=dct['geom'],
             sym_factor=sym_factor,
             interp_emax=None
         )
-        rpath_str += mess_io.writer.molecule(
+        mol_str = mess_io.writer.molecule(
             core=core_str,
             freqs=dct['freqs'],
             elec_levels=elec_levels,
@@ -385,8 +379,14 @@ def rpvtst_block(ts_inf_dct, inf_dct_i, inf_dct_j):
             rot_dists=()
         )
 
-        # Append rxn path pt string to full list of rpath strings
-        rpath_strs.append(rpath_str)
+        # Assemble the headed rxn path pt string in one pass and add it
+        # to the full list of rpath strings
+        rpath_strs.append(
+            '!-----------------------------------------------\n'
+            f'! Rxn Path Pt {str(idx+1)}: '
+            f'R = {dct["rval"]*phycon.BOHR2ANG:.2f} Ang'
+            '\n\n'
+            f'{mol_str}')
 
     return rpath_strs, {}
 #
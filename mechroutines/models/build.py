@@ -7,6 +7,8 @@
 """
 
 import os
+from concurrent.futures import ThreadPoolExecutor
+
 import automol
 import elstruct
 import autofile
@@ -256,9 +258,12 @@ def atm_data(spc_dct, spc_name,
     """
 
     spc_dct_i = spc_dct[spc_name]
-    # Set up all the filesystem objects using models and levels
+    # Set up the filesystem objects using models and levels; atoms only
+    # require the geometry and electronic energy from the harmonic slot,
+    # so skip building the symm/tors/vpt2 filesystems
+    atm_mod_dct_i = {'vib': spc_mod_dct_i['vib']}
     pf_filesystems = filesys.models.pf_filesys(
-        spc_dct_i, spc_mod_dct_i, run_prefix, save_prefix, False)
+        spc_dct_i, atm_mod_dct_i, run_prefix, save_prefix, False)
 
     ioprinter.info_message(
         'Obtaining the geometry...', newline=1)
@@ -897,44 +902,45 @@ def tau_data(spc_dct_i,
     ioprinter.info_message(
         'Reading data for the Monte Carlo samples from db.json'
         f'at path {tau_save_fs[0].path()}')
+    # Bind the sample readers once; the db-style branches otherwise
+    # re-evaluate for every sample in the loop below
+    if db_style == 'directory':
+        samp_fs = tau_save_fs[-1].file
+    elif db_style == 'jsondb':
+        samp_fs = tau_save_fs[-1].json
+
+    def _read_samp(locs):
+        """ Read all of the requested data for one Monte Carlo sample
+        """
+        geo = samp_fs.geometry.read(locs)
+        ene = samp_fs.energy.read(locs)
+        if vib_model == 'tau':
+            grad = samp_fs.gradient.read(locs)
+            hess = samp_fs.hessian.read(locs)
+        else:
+            grad, hess = None, None
+        return geo, ene, grad, hess
+
+    # The per-sample reads are independent small-file I/O; fan them out
+    # across threads and collect the results in locs order
     samp_geoms, samp_enes, samp_grads, samp_hessians = [], [], [], []
     tot_locs = len(tau_locs)
-    for idx, locs in enumerate(tau_locs):
-
-        if db_style == 'directory':
-            geo = tau_save_fs[-1].file.geometry.read(locs)
-        elif db_style == 'jsondb':
-            geo = tau_save_fs[-1].json.geometry.read(locs)
-
-        # geo_str = autofile.data_types.swrite.geometry(geo)
-        samp_geoms.append(geo)
-
-        if db_style == 'directory':
-            tau_ene = tau_save_fs[-1].file.energy.read(locs)
-        elif db_style == 'jsondb':
-            tau_ene = tau_save_fs[-1].json.energy.read(locs)
-        rel_ene = (tau_ene - min_cnf_ene) * phycon.EH2KCAL
-        # ene_str = autofile.data_types.swrite.energy(rel_ene)
-        samp_enes.append(rel_ene)
-
-        if vib_model == 'tau':
-            if db_style == 'directory':
-                grad = tau_save_fs[-1].file.gradient.read(locs)
-            elif db_style == 'jsondb':
-                grad = tau_save_fs[-1].json.gradient.read(locs)
-            # grad_str = autofile.data_types.swrite.gradient(grad)
-            samp_grads.append(grad)
-
-            if db_style == 'directory':
-                hess = tau_save_fs[-1].file.hessian.read(locs)
-            elif db_style == 'jsondb':
-                hess = tau_save_fs[-1].json.hessian.read(locs)
-            # hess_str = autofile.data_types.swrite.hessian(hess)
-            samp_hessians.append(hess)
-
-        # Print progress message (every 150 geoms read)
-        if idx % 149 == 0:
-            print(f'Read {idx+1}/{tot_locs} samples...')
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        for idx, (geo, ene, grad, hess) in enumerate(
+                pool.map(_read_samp, tau_locs)):
+
+            samp_geoms.append(geo)
+            samp_enes.append(ene)
+            if vib_model == 'tau':
+                samp_grads.append(grad)
+                samp_hessians.append(hess)
+
+            # Print progress message (every 150 geoms read)
+            if idx % 149 == 0:
+                print(f'Read {idx+1}/{tot_locs} samples...')
+
+    # Convert the sample energies relative to the minimum in a single pass
+    samp_enes = [(ene - min_cnf_ene) * phycon.EH2KCAL for ene in samp_enes]
 
     # Determine the successful conformer ratio
     inf_obj = tau_save_fs[0].file.info.read()
@@ -96,6 +96,12 @@ def electronic_energy(spc_dct_i, pf_filesystems, spc_model_dct_i, conf=None):
     return e_elec
 
 
+# The vibrational analysis behind the ZPVE runs external ProjRot/MESS jobs;
+# basis species recur across many enthalpy evaluations, so cache the result
+# per conformer path and species model
+_ZPE_CACHE = {}
+
+
 def zero_point_energy(spc_dct_i,
                       pf_filesystems, spc_model_dct_i,
                       run_prefix, saddle=False):
@@ -112,10 +118,19 @@ def zero_point_energy(spc_dct_i,
     if is_atom:
         zpe = 0.0
     else:
-        vib_anal_dct = vib.full_vib_analysis(
-            spc_dct_i, pf_filesystems, spc_model_dct_i,
-            run_prefix, zrxn=(None if not saddle else 'placeholder'))
-        zpe = vib_anal_dct['anharm_zpe']
+        harm_path = None
+        if pf_filesystems['harm'] is not None:
+            harm_path = pf_filesystems['harm'][1]
+        key = (harm_path, id(spc_model_dct_i), saddle)
+        if harm_path is not None and key in _ZPE_CACHE:
+            zpe = _ZPE_CACHE[key]
+        else:
+            vib_anal_dct = vib.full_vib_analysis(
+                spc_dct_i, pf_filesystems, spc_model_dct_i,
+                run_prefix, zrxn=(None if not saddle else 'placeholder'))
+            zpe = vib_anal_dct['anharm_zpe']
+            if harm_path is not None:
+                _ZPE_CACHE[key] = zpe
 
     return zpe
 
@@ -134,7 +134,7 @@ def frequencies(
 
         vib_anal_dct = vib.full_vib_analysis(
             spc_dct_i, pf_filesystems, spc_mod_dct_i,
-            run_prefix, zrxn=zrxn)
+            run_prefix, zrxn=zrxn, read_disps=True)
         freqs = vib_anal_dct['fund_proj_RTimagTors']
         imag = vib_anal_dct['harm_imag']
         zpe = vib_anal_dct['anharm_zpe']
@@ -158,7 +158,7 @@ def frequencies(
         es_levels = util.freq_es_levels(proc_keyword_dct)
         spc_mod_dct_i = util.generate_spc_model_dct(es_levels, thy_dct)
         ret = vib.read_locs_harmonic_freqs(
-            cnf_fs, locs, run_prefix, zrxn=zrxn)
+            cnf_fs, locs, run_prefix, zrxn=zrxn, read_disps=True)
         freqs, imag, zpe, disps = ret
         if freqs or imag:
             if freqs and proc_keyword_dct['scale'] is not None: